@@ -0,0 +1,43 @@
+"""
+Import time benchmark for bracketology.
+
+Runs each snippet in a fresh interpreter so nothing is cached between runs,
+and reports the median wall time of the snippet itself.
+
+    python benchmarks/bench_import.py [--repeat 20]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SNIPPETS = {
+    'import bracketology': 'import bracketology',
+    'import + Bracket(2019)': 'import bracketology; bracketology.Bracket(2019)',
+    'import + engine': 'import bracketology.engine',
+}
+
+TIMER = '''
+import time
+start = time.perf_counter()
+{snippet}
+print(time.perf_counter() - start)
+'''
+
+def time_snippet(snippet, repeat):
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', TIMER.format(snippet=snippet)],
+                             check=True, capture_output=True, text=True)
+        times.append(float(out.stdout))
+    return statistics.median(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    for name, snippet in SNIPPETS.items():
+        print(f"{name:<28}{time_snippet(snippet, args.repeat) * 1000:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
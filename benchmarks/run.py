@@ -0,0 +1,85 @@
+"""
+Run the bracketology benchmark suite and compare it with a stored baseline.
+
+    python benchmarks/run.py                  # run and print the timings
+    python benchmarks/run.py --save           # store the timings as the baseline
+    python benchmarks/run.py --compare        # fail if anything got slower
+
+Baselines are machine specific, save a new one before comparing on a
+different machine.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_import import SNIPPETS, time_snippet
+from suite import BENCHMARKS
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+def time_benchmark(factory, repeat):
+    func = factory()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def run(names, repeat):
+    results = {}
+    for name in names:
+        if name.startswith('import:'):
+            results[name] = time_snippet(SNIPPETS[name[len('import:'):]], repeat)
+        else:
+            results[name] = time_benchmark(BENCHMARKS[name], repeat)
+        print(f"{name:<40}{format_time(results[name]):>12}", flush=True)
+    return results
+
+def compare(results, baseline, threshold):
+    slower = []
+    print(f"\n{'benchmark':<40}{'baseline':>12}{'now':>12}{'ratio':>8}")
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        ratio = seconds / baseline[name]
+        flag = '  SLOWER' if ratio > threshold else ''
+        print(f"{name:<40}{format_time(baseline[name]):>12}{format_time(seconds):>12}{ratio:>8.2f}{flag}")
+        if ratio > threshold:
+            slower.append(name)
+    return slower
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('names', nargs='*', help="benchmarks to run, the default is all")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--save', action='store_true', help="store the timings as the baseline")
+    parser.add_argument('--compare', action='store_true', help="compare with the baseline")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="slowdown ratio that counts as a regression")
+    args = parser.parse_args()
+
+    names = args.names or [f'import:{name}' for name in SNIPPETS] + list(BENCHMARKS)
+    results = run(names, args.repeat)
+
+    if args.save:
+        with open(BASELINE_FILE, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+        slower = compare(results, baseline, args.threshold)
+        if slower:
+            print(f"\n{len(slower)} benchmark(s) slower than {args.threshold}x the baseline")
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmarks of the bracketology hot paths.
+
+Each benchmark does its setup and returns the function to time. They are
+run by ``benchmarks/run.py``.
+"""
+import random
+from bracketology import Bracket, SubBracket16, simulators
+from bracketology.fields import get_field
+
+N_BATCH = 100_000
+
+def bench_bracket_construction():
+    return lambda: Bracket(2019)
+
+def bench_bracket_from_field():
+    field = get_field(2019)
+    return lambda: Bracket.from_field(field)
+
+def bench_bracket_sim():
+    random.seed(0)
+    bracket = Bracket(2019)
+    sim_func = simulators.upset_prob(0.2)
+    return lambda: bracket.sim(sim_func)
+
+def bench_subbracket_run_bracket():
+    random.seed(0)
+    teams = get_field(2019).region_teams['East']
+    region = SubBracket16('East').initialize_first_round(teams)
+    sim_func = simulators.upset_prob(0.2)
+    return lambda: region.run_bracket(sim_func)
+
+def bench_bracket_score():
+    random.seed(0)
+    bracket = Bracket(2019)
+    bracket.sim(simulators.upset_prob(0.2))
+    return lambda: bracket.score(verbose=False)
+
+def bench_bracket_sim_and_score():
+    random.seed(0)
+    bracket = Bracket(2019)
+    sim_func = simulators.upset_prob(0.2)
+    return lambda: bracket.score(sim_func, verbose=False)
+
+def bench_engine_simulate_100k():
+    from bracketology import engine
+    win_prob = simulators.upset_prob_batch(0.2)
+    return lambda: engine.simulate(2019, N_BATCH, win_prob, rng=0)
+
+def bench_score_brackets_100k():
+    from bracketology import engine
+    from bracketology.scoring import score_brackets
+    winners = engine.simulate(2019, N_BATCH, simulators.upset_prob_batch(0.2), rng=0)
+    return lambda: score_brackets(2019, winners)
+
+def bench_pack_outcomes_100k():
+    from bracketology import engine
+    from bracketology.compact import pack_outcomes
+    winners = engine.simulate(2019, N_BATCH, simulators.upset_prob_batch(0.2), rng=0)
+    return lambda: pack_outcomes(winners)
+
+def bench_advancement_probabilities():
+    from bracketology.probability import advancement_probabilities
+    win_prob = simulators.upset_prob_batch(0.2)
+    return lambda: advancement_probabilities(2019, win_prob)
+
+BENCHMARKS = {name[len('bench_'):]: func for name, func in sorted(globals().items())
+              if name.startswith('bench_')}
@@ -1,3 +1,17 @@
 __version__ = '0.0.8'
 from bracketology.brackets import Team, Game, SubBracket16, FinalFour, Bracket
-import bracketology.simulators
+import importlib
+
+# Submodules that are imported the first time they are used, so that
+# `import bracketology` stays fast
+_LAZY_SUBMODULES = ('simulators', 'engine', 'fields', 'compact', 'backtest', 'dataset',
+                    'scoring', 'probability', 'streaming', 'rng',
+                    'profiling', 'optimize', 'live', 'history', 'stats', 'storage',
+                    'dedup', 'batched', 'sweep', 'topology', 'pool')
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f'bracketology.{name}')
+    if name == 'profile':
+        return importlib.import_module('bracketology.profiling').profile
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,4 @@
+import sys
+from bracketology.cli import main
+
+sys.exit(main())
@@ -0,0 +1,112 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from bracketology.brackets import Bracket
+from bracketology.simulators import rebind_rng
+
+YEARS = range(1985, 2019+1)
+
+def backtest(sim_func, years=YEARS, n_trials=100, workers=None, seed=0, chunk_size=50):
+    """
+    Score `sim_func` against the actual results of many years, running
+    `n_trials` simulations per year across a pool of worker processes.
+
+    The trials for each year are split into chunks of `chunk_size`, and each
+    chunk seeds the `random` module from `seed`, the year and the chunk number,
+    and puts its state back afterwards.
+    A simulator created with its own `rng` is rebound to a stream seeded the
+    same way (see `bracketology.simulators.rebind_rng`), so the seed it was
+    created with is not used. The results only depend on `seed` and
+    `chunk_size`, not on how many workers run the chunks.
+
+    Parameters
+    ----------
+    sim_func : function
+        A function that take in `Game` and returns a `Team` of that Game.
+        It is sent to the workers, so it must be picklable (a module level
+        function or one returned by `bracketology.simulators`)
+    years : iterable of int, optional
+        Years of the NCAA tournament to simulate. The default is 1985-2019
+    n_trials : int, optional
+        Number of simulations per year. The default is 100
+    workers : int, optional
+        Number of worker processes. The default is the number of CPUs,
+        use 1 to run everything in this process
+    seed : int, optional
+        Seed for the random number generators. The default is 0
+    chunk_size : int, optional
+        Number of simulations per task. The default is 50
+
+    Returns
+    -------
+    results : dict
+        For each year, the number of trials and the mean and standard
+        deviation of ``total_score``, ``n_games_correct`` and of the number
+        of games correct in each round (``rounds``, a list of 6)
+    """
+    years = [int(year) for year in years]
+    tasks = [(sim_func, year, start, min(chunk_size, n_trials - start), seed)
+             for year in years for start in range(0, n_trials, chunk_size)]
+
+    if workers == 1:
+        chunks = map(_run_chunk, tasks)
+        results = _combine(years, chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = executor.map(_run_chunk, tasks)
+            results = _combine(years, chunks)
+    return results
+
+def _run_chunk(task):
+    # Simulate one chunk of trials and return integer sums of each metric
+    # and their squares, so combining chunks is exact in any order
+    sim_func, year, start, n_trials, seed = task
+    chunk_seed = np.random.SeedSequence([seed, year, start])
+    # A simulator with its own generator would otherwise replay the same
+    # pickled stream in every chunk
+    sim_func = rebind_rng(sim_func, chunk_seed.spawn(1)[0])
+
+    sums = [0] * 8      # total_score, n_games_correct, round1, ..., round6
+    squares = [0] * 8
+    bracket = Bracket(year)
+    # Simulators that use the `random` module get it seeded for the chunk.
+    # With workers=1 this is the caller's process, so its state is put back
+    random_state = random.getstate()
+    random.seed(int(chunk_seed.generate_state(1)[0]))
+    try:
+        for _ in range(n_trials):
+            bracket.score(sim_func, verbose=False)
+            metrics = [bracket.total_score, bracket.n_games_correct] + bracket.n_correct_by_round
+            for i, value in enumerate(metrics):
+                sums[i] += value
+                squares[i] += value * value
+    finally:
+        random.setstate(random_state)
+    return year, n_trials, sums, squares
+
+def _combine(years, chunks):
+    totals = {year: [0, [0] * 8, [0] * 8] for year in years}
+    for year, n_trials, sums, squares in chunks:
+        total = totals[year]
+        total[0] += n_trials
+        total[1] = [a + b for a, b in zip(total[1], sums)]
+        total[2] = [a + b for a, b in zip(total[2], squares)]
+
+    results = {}
+    for year, (n, sums, squares) in totals.items():
+        stats = [_mean_std(n, s, sq) for s, sq in zip(sums, squares)]
+        results[year] = {
+            'n_trials': n,
+            'total_score': stats[0],
+            'n_games_correct': stats[1],
+            'rounds': stats[2:],
+        }
+    return results
+
+def _mean_std(n, total, square_total):
+    if n == 0:
+        return {'mean': math.nan, 'std': math.nan}
+    mean = total / n
+    variance = max(square_total / n - mean * mean, 0.0)
+    return {'mean': mean, 'std': math.sqrt(variance)}
@@ -0,0 +1,141 @@
+import asyncio
+from bracketology.brackets import Bracket
+from bracketology.compact import REGION_NAMES
+from bracketology.profiling import ROUND_METHODS
+
+def round_games(bracket, round_number):
+    """
+    The games of one round of a bracket, once the rounds before it have
+    been simulated.
+
+    Parameters
+    ----------
+    bracket : Bracket
+        The bracket
+    round_number : int
+        Round number, first round is 1, championship game is 6
+
+    Returns
+    -------
+    games : list of Game
+        Regions in the order East, West, Midwest, South, then the final four
+    """
+    if round_number <= 4:
+        regions = [getattr(bracket, region) for region in REGION_NAMES]
+        if round_number == 4:
+            return [region.Game15 for region in regions]
+        return [game for region in regions for game in getattr(region, f'round{round_number}')]
+    if round_number == 5:
+        return [bracket.Finals.Game1, bracket.Finals.Game2]
+    return [bracket.Finals.Championship]
+
+class _RoundResults():
+    # A sim_func that returns winners already decided by a batch predictor
+    def __init__(self, games, winners):
+        if len(winners) != len(games):
+            raise ValueError(f"predictor returned {len(winners)} winners for {len(games)} games")
+        self.winners = {id(game): winner for game, winner in zip(games, winners)}
+
+    def __call__(self, the_game):
+        return self.winners[id(the_game)]
+
+def sim_batched(brackets, predictor):
+    """
+    Simulate brackets a round at a time, calling `predictor` once per round
+    with every game of that round in every bracket. Six calls fill out any
+    number of brackets, instead of 63 `sim_func` calls per bracket.
+
+    Parameters
+    ----------
+    brackets : Bracket or list of Bracket
+        Brackets to simulate
+    predictor : function
+        A function that takes a list of `Game` and returns a list of the
+        winning `Team` of each game
+
+    Returns
+    -------
+    brackets : Bracket or list of Bracket
+        The simulated brackets
+    """
+    single = isinstance(brackets, Bracket)
+    all_brackets = [brackets] if single else list(brackets)
+    for round_number, method in enumerate(ROUND_METHODS, start=1):
+        games = [round_games(bracket, round_number) for bracket in all_brackets]
+        flat = [game for bracket_games in games for game in bracket_games]
+        results = _RoundResults(flat, predictor(flat))
+        for bracket in all_brackets:
+            getattr(bracket, method)(results)
+    return brackets
+
+async def sim_batched_async(brackets, predictor, max_in_flight=None):
+    """
+    Asynchronous version of `sim_batched` for predictors behind a server.
+
+    Each bracket calls the predictor once per round, and the brackets run
+    concurrently, so while one waits for its predictions others are
+    simulating or waiting for theirs.
+
+    Parameters
+    ----------
+    brackets : Bracket or list of Bracket
+        Brackets to simulate
+    predictor : coroutine function
+        An ``async`` function that takes a list of `Game` and returns a
+        list of the winning `Team` of each game
+    max_in_flight : int, optional
+        Most predictor calls waiting at once, the default is no limit
+
+    Returns
+    -------
+    brackets : Bracket or list of Bracket
+        The simulated brackets
+    """
+    single = isinstance(brackets, Bracket)
+    all_brackets = [brackets] if single else list(brackets)
+    limit = asyncio.Semaphore(max_in_flight) if max_in_flight is not None else None
+
+    async def predict(games):
+        if limit is None:
+            return await predictor(games)
+        async with limit:
+            return await predictor(games)
+
+    async def sim_one(bracket):
+        for round_number, method in enumerate(ROUND_METHODS, start=1):
+            games = round_games(bracket, round_number)
+            getattr(bracket, method)(_RoundResults(games, await predict(games)))
+
+    await asyncio.gather(*(sim_one(bracket) for bracket in all_brackets))
+    return brackets
+
+class LocalPredictor():
+    """
+    A batch predictor that runs a per-game `sim_func` on each game, for
+    testing code written against a model server. Counts its calls.
+
+    Calling it returns the winners directly, and `predict_async` waits
+    `latency` seconds first to stand in for a round trip to a server.
+    """
+    def __init__(self, sim_func, latency=0.0):
+        """
+        Parameters
+        ----------
+        sim_func : function
+            A function that take in `Game` and returns a `Team` of that Game
+        latency : float, optional
+            Seconds `predict_async` waits before answering
+        """
+        self.sim_func = sim_func
+        self.latency = latency
+        self.n_calls = 0
+        self.n_games = 0
+
+    def __call__(self, games):
+        self.n_calls += 1
+        self.n_games += len(games)
+        return [self.sim_func(game) for game in games]
+
+    async def predict_async(self, games):
+        await asyncio.sleep(self.latency)
+        return self(games)
@@ -1,8 +1,10 @@
-import json
-from pkg_resources import resource_filename
-filepath = resource_filename('bracketology', 'data/brackets.json')
-with open(filepath, 'r') as f:
-    brackets_dict = json.load(f)
+from bracketology.dataset import load_brackets
+
+def __getattr__(name):
+    # `brackets_dict` is loaded on first access instead of at import time
+    if name == 'brackets_dict':
+        return load_brackets()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 class Team():
     """
@@ -15,8 +17,13 @@ class Team():
     seed : int
         Seed of the team in the tournament (1-16)
     stats : (dict)
-        A dictionary with other information about the team, like season stats
+        A dictionary with other information about the team, like season stats.
+        Teams of a `Field` are shared, their stats start as an empty read-only
+        mapping and `bracketology.stats.StatsStore.attach` replaces it with a read-only
+        `TeamStats` mapping that reads from a shared memory-mapped file
     """
+    __slots__ = ('name', 'seed', 'stats')
+
     def __init__(self, name, seed):
         """
         Parameters
@@ -47,6 +54,8 @@ class Game():
     round_number : int
         Which round of the tournament is it (1-6)
     """
+    __slots__ = ('top_team', 'bottom_team', 'round_number')
+
     def __init__(self, top_team, bottom_team, round_number):
         """
         Parameters
@@ -185,6 +194,18 @@ class SubBracket16():
         self.winner = sim_func(self.Game15)
         return self
         
+    def reset(self):
+        """
+        Clear the simulated rounds, keeping the teams and first round games
+        """
+        for game_number in range(9, 16):
+            self.__dict__.pop(f'Game{game_number}', None)
+        self.round2 = []
+        self.round3 = []
+        self.round4 = []
+        self.winner = None
+        return self
+
     def run_bracket(self, sim_func):
         self.run_first_round(sim_func)
         self.run_second_round(sim_func)
@@ -232,11 +253,9 @@ class FinalFour():
         year : int
             Year of the NCAA tournament
         """
+        from bracketology.fields import get_field
         self.year = str(year)
-        
-        # Get bracket dict
-        bracket = brackets_dict.get(self.year)
-        self.final_matches = bracket.get('Finals')
+        self.final_matches = get_field(year).final_matches
         
         self.Game1 = None
         self.Game2 = None
@@ -250,6 +269,15 @@ class FinalFour():
         
         return f"{winner_header}{self.winner}{championship_header}{self.Championship}{final_four_header}{self.Game1}{self.Game2}\n"
         
+    def reset(self):
+        """
+        Clear the simulated games
+        """
+        self.Game1 = None
+        self.Game2 = None
+        self.Championship = None
+        self.winner = None
+
     def set_matches(self, teams):
         
         game1 = self.final_matches.get('game1')
@@ -275,11 +303,18 @@ class FinalFour():
 class Bracket():
     """
     A NCAA tournament for a specific year
+
+    Every `Bracket` of a year is built from the same cached `Field`, so
+    the `Team` objects (and their ``stats``) are shared by all of them and
+    must not be changed. Simulating only changes the bracket's own rounds
+    and games.
     
     Attributes
     ----------
     year : int
         Calendar year of the tournament (1985-2019)
+    field : (Field)
+        The cached teams and results the bracket is built from
     result : (dict)
         The actual tournament results for that year
     regions : (dict)
@@ -300,6 +335,8 @@ class Bracket():
         Simulated tournament winner
     n_games_correct int
         Number of games the simulation got correct
+    n_correct_by_round : (list of int)
+        Number of games the simulation got correct in each of the 6 rounds
     total_score int
         Total points earned by the simulator function (32 points per round)
     """
@@ -318,34 +355,61 @@ class Bracket():
         if year not in valid_years:
             raise ValueError("Year must be between 1985 and 2019")
         
+        from bracketology.fields import get_field
+        self._set_field(get_field(year))
+
+    @classmethod
+    def from_field(cls, field):
+        """
+        Create a bracket from a cached `bracketology.fields.Field`, sharing
+        its teams instead of rebuilding them
+
+        Parameters
+        ----------
+        field : Field
+            The teams and results of the tournament, see `get_field`
+        """
+        bracket = cls.__new__(cls)
+        bracket._set_field(field)
+        return bracket
+
+    def _set_field(self, field):
         # Set year
-        self.year = str(year)
+        self.year = field.year
+        self.field = field
         
         # Get bracket dict
-        bracket = brackets_dict.get(self.year)
-        self.result = bracket.get('Results')
-        self.regions = bracket.get('Region')        
+        self.result = field.result
+        self.regions = field.regions_data
         
         # Get Team Lists
-        east_teams = [];    add_east = east_teams.append
-        west_teams = [];    add_west = west_teams.append
-        midwest_teams = []; add_midwest = midwest_teams.append
-        south_teams = [];   add_south = south_teams.append
-
-        for team in self.regions['East']: add_east(Team(name=team['Team'], seed=team['Seed']))
-        for team in self.regions['West']: add_west(Team(name=team['Team'], seed=team['Seed']))
-        for team in self.regions['Midwest']: add_midwest(Team(name=team['Team'], seed=team['Seed']))
-        for team in self.regions['South']: add_south(Team(name=team['Team'], seed=team['Seed']))
+        east_teams = field.region_teams['East']
+        west_teams = field.region_teams['West']
+        midwest_teams = field.region_teams['Midwest']
+        south_teams = field.region_teams['South']
 
         # Create Region Brackets
         self.East = SubBracket16('East').initialize_first_round(east_teams)
         self.West = SubBracket16('West').initialize_first_round(west_teams)
         self.Midwest = SubBracket16('Midwest').initialize_first_round(midwest_teams)
         self.South = SubBracket16('South').initialize_first_round(south_teams)
-        self.Finals = FinalFour(year)
+        self.Finals = FinalFour(field.year)
         
         # Initalize teams in each round
-        self.round1 = east_teams + west_teams + midwest_teams + south_teams
+        self.round1 = list(east_teams + west_teams + midwest_teams + south_teams)
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the simulated rounds and scores so the bracket can be simulated
+        again, without rebuilding the teams or first round games
+        """
+        self.East.reset()
+        self.West.reset()
+        self.Midwest.reset()
+        self.South.reset()
+        self.Finals.reset()
+        
         self.round2 = [] # 8 teams left in each region
         self.round3 = [] # sweet 16, 4 teams left in each region
         self.round4 = [] # elite 8, 2 teams left in each region
@@ -355,7 +419,9 @@ class Bracket():
         
         # Initialize Scores
         self.n_games_correct = 0
+        self.n_correct_by_round = [0, 0, 0, 0, 0, 0]
         self.total_score = 0
+        return self
         
     def run_first_round(self, sim_func):
         """
@@ -531,13 +597,16 @@ class Bracket():
         else:
             self.sim(sim_func)
         
-        n_correct_round1 = len(set([team['Team'] for team in self.result['second']]).intersection([team.name for team in self.round2]))
-        n_correct_round2 = len(set([team['Team'] for team in self.result['sweet16']]).intersection([team.name for team in self.round3]))
-        n_correct_round3 = len(set([team['Team'] for team in self.result['elite8']]).intersection([team.name for team in self.round4]))
-        n_correct_round4 = len(set([team['Team'] for team in self.result['final4']]).intersection([team.name for team in self.round5]))
-        n_correct_round5 = len(set([team['Team'] for team in self.result['championship']]).intersection([team.name for team in self.round6]))
-        correct_winner = int(self.winner.name == self.result['winner'])
+        result_sets = self.field.result_sets
+        n_correct_round1 = len(result_sets['second'].intersection([team.name for team in self.round2]))
+        n_correct_round2 = len(result_sets['sweet16'].intersection([team.name for team in self.round3]))
+        n_correct_round3 = len(result_sets['elite8'].intersection([team.name for team in self.round4]))
+        n_correct_round4 = len(result_sets['final4'].intersection([team.name for team in self.round5]))
+        n_correct_round5 = len(result_sets['championship'].intersection([team.name for team in self.round6]))
+        correct_winner = int(self.winner.name == self.field.result_winner)
         
+        self.n_correct_by_round = [n_correct_round1, n_correct_round2, n_correct_round3,
+                                   n_correct_round4, n_correct_round5, correct_winner]
         self.n_games_correct = n_correct_round1 + n_correct_round2 + n_correct_round3 + \
                                n_correct_round4 + n_correct_round5 + correct_winner
         
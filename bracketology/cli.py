@@ -0,0 +1,167 @@
+import argparse
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+import numpy as np
+from bracketology import simulators
+from bracketology.compact import pack_outcomes
+from bracketology.dataset import load_brackets
+from bracketology.engine import simulate
+from bracketology.scoring import SCORING_SYSTEMS, score_brackets
+from bracketology.storage import FORMATS, SimulationWriter
+from bracketology.streaming import RunningStats
+
+# Simulators the command line can run, by name. Each takes its parameters
+# as positional arguments and returns a batch win_prob for the engine
+SIMULATORS = {
+    'upset_prob': lambda p=0.2: simulators.upset_prob_batch(float(p)),
+    'seed_matchup': lambda strength=10.0: simulators.seed_matchup_prob_batch(float(strength)),
+}
+
+def _simulate_task(task):
+    # Simulate one chunk in a worker, returning compact codes and scores
+    # rather than the full winner array to keep what is sent back small
+    name, params, year, chunk, size, seed, scoring = task
+    win_prob = SIMULATORS[name](*params)
+    rng = np.random.default_rng(np.random.SeedSequence([seed, year, chunk]))
+    winners = simulate(year, size, win_prob, rng=rng)
+    n_correct_by_round, total_score = score_brackets(year, winners, scoring)
+    return pack_outcomes(winners), total_score, n_correct_by_round.sum(axis=1)
+
+def run_simulations(year, n, simulator='upset_prob', params=(), workers=None, seed=0,
+                    chunk_size=2**16, scoring='standard', output=None, model_id=None,
+                    file_format='codes'):
+    """
+    Simulate and score brackets for one year across worker processes,
+    optionally writing them to a file (see `bracketology.storage`).
+
+    Each chunk of `chunk_size` brackets is seeded from `seed`, the year and
+    the chunk number, so the brackets do not depend on the number of workers.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    n : int
+        Number of brackets
+    simulator : str, optional
+        Name of the simulator, one of `SIMULATORS`
+    params : tuple, optional
+        Parameters of the simulator
+    workers : int, optional
+        Number of worker processes. The default is the number of CPUs,
+        use 1 to run everything in this process
+    seed : int, optional
+        Seed for the random numbers
+    chunk_size : int, optional
+        Number of brackets per task
+    scoring : str, optional
+        Scoring system, one of `bracketology.scoring.SCORING_SYSTEMS`
+    output : str, optional
+        File to write the brackets to
+    model_id : str, optional
+        Model name stored in the file, the default is the simulator and its parameters
+    file_format : {'codes', 'winners'}, optional
+        How the brackets are stored in the file
+
+    Returns
+    -------
+    total_score : RunningStats
+        Statistics of the total score
+    n_games_correct : RunningStats
+        Statistics of the number of games correct
+    """
+    if simulator not in SIMULATORS:
+        raise ValueError(f"simulator must be one of {sorted(SIMULATORS)}")
+    params = tuple(params)
+    if model_id is None:
+        model_id = ':'.join([simulator] + [str(param) for param in params])[:32]
+    tasks = [(simulator, params, int(year), chunk, min(chunk_size, n - start), seed, scoring)
+             for chunk, start in enumerate(range(0, n, chunk_size))]
+
+    total_score, n_games_correct = RunningStats(), RunningStats()
+    writer = None if output is None else SimulationWriter(output, year, model_id, seed, file_format)
+    executor = None if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    try:
+        results = map(_simulate_task, tasks) if executor is None else executor.map(_simulate_task, tasks)
+        for codes, scores, correct in results:
+            if writer is not None:
+                writer.write_codes(codes)
+            total_score.update(scores)
+            n_games_correct.update(correct)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if writer is not None:
+            writer.close()
+    return total_score, n_games_correct
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='bracketology',
+                                     description='Analyze and simulate NCAA march madness tournaments')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sim = commands.add_parser('simulate', help='simulate and score many brackets')
+    sim.add_argument('--years', type=int, nargs='+', default=[2019],
+                     help='tournament years (default: 2019)')
+    sim.add_argument('-n', '--n-sims', type=int, default=100_000,
+                     help='brackets per year (default: 100000)')
+    sim.add_argument('--simulator', choices=sorted(SIMULATORS), default='upset_prob',
+                     help='simulator to run (default: upset_prob)')
+    sim.add_argument('--param', dest='params', type=float, nargs='*', default=[],
+                     help='simulator parameters, e.g. the upset probability')
+    sim.add_argument('--workers', type=int, default=None,
+                     help='worker processes (default: number of CPUs)')
+    sim.add_argument('--seed', type=int, default=0, help='random seed (default: 0)')
+    sim.add_argument('--chunk-size', type=int, default=2**16,
+                     help='brackets per task (default: 65536)')
+    sim.add_argument('--scoring', choices=sorted(SCORING_SYSTEMS), default='standard',
+                     help='scoring system (default: standard)')
+    sim.add_argument('-o', '--output',
+                     help='file to write the brackets to, with {year} in the name for several years')
+    sim.add_argument('--format', dest='file_format', choices=FORMATS, default='codes',
+                     help='how brackets are stored in the output file (default: codes)')
+    return parser
+
+def main(argv=None):
+    """
+    Entry point of the ``bracketology`` command
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.output is not None and len(args.years) > 1 and '{year}' not in args.output:
+        parser.error("--output needs {year} in it when simulating several years")
+    unknown = [year for year in args.years if str(year) not in load_brackets()]
+    if unknown:
+        years = sorted(int(year) for year in load_brackets())
+        parser.error(f"no tournament data for {', '.join(map(str, unknown))}, "
+                     f"--years must be between {years[0]} and {years[-1]}")
+    if args.n_sims < 1 or args.chunk_size < 1:
+        parser.error("--n-sims and --chunk-size must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    # Check the parameters here rather than in every worker
+    n_params = len(inspect.signature(SIMULATORS[args.simulator]).parameters)
+    if len(args.params) > n_params:
+        parser.error(f"{args.simulator} takes at most {n_params} --param value(s), "
+                     f"got {len(args.params)}")
+    try:
+        SIMULATORS[args.simulator](*args.params)
+    except (AssertionError, ValueError) as e:
+        parser.error(f"bad --param for {args.simulator}: {e}")
+
+    for year in args.years:
+        output = None if args.output is None else args.output.format(year=year)
+        start = perf_counter()
+        total_score, n_games_correct = run_simulations(
+            year, args.n_sims, args.simulator, args.params, workers=args.workers, seed=args.seed,
+            chunk_size=args.chunk_size, scoring=args.scoring, output=output,
+            file_format=args.file_format)
+        elapsed = perf_counter() - start
+        print(f"{year}: {total_score.count:,} brackets in {elapsed:.2f}s "
+              f"({total_score.count / elapsed:,.0f} brackets/s), "
+              f"score {total_score.mean:.2f} +/- {total_score.std:.2f}, "
+              f"games correct {n_games_correct.mean:.2f}"
+              + ("" if output is None else f", wrote {output}"))
+    return 0
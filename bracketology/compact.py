@@ -0,0 +1,318 @@
+import numpy as np
+from bracketology.brackets import Game, Bracket
+from bracketology.engine import N_GAMES, ROUND_SLICES, ROUND_OF_GAME
+from bracketology.fields import get_field
+
+# Region names in the order `Bracket` lists them in `round1`, ..., `round5`
+REGION_NAMES = ('East', 'West', 'Midwest', 'South')
+
+# Bit position of each game within an outcome code
+_GAME_BITS = np.arange(N_GAMES, dtype=np.uint64)
+# Bit of a game's winner index that says whether the bottom team won
+_GAME_SHIFTS = (ROUND_OF_GAME - 1).astype(np.uint8)
+
+def pack_outcomes(winners):
+    """
+    Pack winner rows into 63-bit outcome codes.
+
+    Bit ``g`` of a code is set when the bottom team won game ``g``. Because
+    teams are numbered in bracket order, the team that wins a round ``r``
+    game came from the bottom half of it exactly when bit ``r - 1`` of its
+    index is set.
+
+    Parameters
+    ----------
+    winners : numpy.ndarray
+        Array of shape (n, 63) or (63,) of winning team indices,
+        as returned by `bracketology.engine.simulate`
+
+    Returns
+    -------
+    codes : numpy.ndarray or int
+        One uint64 code per bracket
+    """
+    winners = np.asarray(winners, dtype=np.uint8)
+    bits = (winners >> _GAME_SHIFTS) & 1
+    # Packing the 63 bits into 8 little endian bytes is several times
+    # faster than shifting and summing them as uint64
+    packed = np.packbits(bits, axis=-1, bitorder='little')
+    codes = packed.view('<u8')[..., 0].astype(np.uint64, copy=False)
+    return int(codes) if codes.ndim == 0 else codes
+
+def unpack_outcomes(codes):
+    """
+    Unpack 63-bit outcome codes back into winner rows.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray or int
+        Codes as returned by `pack_outcomes`
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        Array of shape (n, 63), or (63,) for a single code
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    bits = ((codes[..., None] >> _GAME_BITS) & np.uint64(1)).astype(np.uint8)
+    winners = np.empty(bits.shape, dtype=np.uint8)
+    first = ROUND_SLICES[0]
+    winners[..., first] = 2 * np.arange(32, dtype=np.uint8) + bits[..., first]
+    for prev, games in zip(ROUND_SLICES, ROUND_SLICES[1:]):
+        children = winners[..., prev]
+        winners[..., games] = np.where(bits[..., games] == 1, children[..., 1::2], children[..., 0::2])
+    return winners
+
+def _region_column(k, round_number, j):
+    # Column of game `j` (within the region) of round `round_number`
+    # for the region in position `k` of the field
+    n_games = 16 >> round_number
+    return ROUND_SLICES[round_number - 1].start + k * n_games + j
+
+class CompactBracket():
+    """
+    A simulated bracket stored as 63 winner indices instead of Game objects.
+
+    Only the array is kept in memory. The `Team` and `Game` objects that
+    `Bracket` exposes (``round3``, ``East.Game9``, ``Finals.Championship``, ...)
+    are built when they are accessed.
+
+    Attributes
+    ----------
+    field : Field
+        The teams in the tournament
+    winners : numpy.ndarray
+        Winning team index of each of the 63 games, same layout as a row of
+        `bracketology.engine.simulate`
+    """
+    __slots__ = ('field', 'winners')
+
+    def __init__(self, year, winners):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        winners : array-like
+            Winning team index of each of the 63 games
+        """
+        winners = np.asarray(winners, dtype=np.uint8)
+        if winners.shape != (N_GAMES,):
+            raise ValueError("winners must have one entry for each of the 63 games")
+        self.field = get_field(year)
+        self.winners = winners
+
+    @classmethod
+    def from_code(cls, year, code):
+        """
+        Create a bracket from a 63-bit outcome code (see `pack_outcomes`)
+        """
+        return cls(year, unpack_outcomes(code))
+
+    @classmethod
+    def from_bracket(cls, bracket):
+        """
+        Create a compact copy of a simulated `Bracket`
+        """
+        if bracket.winner is None:
+            raise Exception("Need to run simulation before compacting")
+        field = get_field(bracket.year)
+        winners = np.empty(N_GAMES, dtype=np.uint8)
+        for k, region in enumerate(field.regions):
+            sub = getattr(bracket, region)
+            round_winners = (
+                [team for game in sub.round2 for team in (game.top_team, game.bottom_team)],
+                [team for game in sub.round3 for team in (game.top_team, game.bottom_team)],
+                [sub.Game15.top_team, sub.Game15.bottom_team],
+                [sub.winner],
+            )
+            for round_number, teams in enumerate(round_winners, start=1):
+                for j, team in enumerate(teams):
+                    winners[_region_column(k, round_number, j)] = field.index[team.name]
+        championship = bracket.Finals.Championship
+        winners[60] = field.index[championship.top_team.name]
+        winners[61] = field.index[championship.bottom_team.name]
+        winners[62] = field.index[bracket.winner.name]
+        return cls(bracket.year, winners)
+
+    @property
+    def year(self):
+        return self.field.year
+
+    @property
+    def code(self):
+        """63-bit outcome code of the bracket"""
+        return pack_outcomes(self.winners)
+
+    def team(self, index):
+        """
+        The `Team` at position `index` of the field
+        """
+        return self.field.teams[index]
+
+    def _teams(self, indices):
+        return [self.team(i) for i in indices]
+
+    @property
+    def round1(self):
+        return [team for region in REGION_NAMES for team in _RegionView(self, region).teams]
+
+    @property
+    def round2(self):
+        return self._round_teams(1)
+
+    @property
+    def round3(self):
+        return self._round_teams(2)
+
+    @property
+    def round4(self):
+        return self._round_teams(3)
+
+    @property
+    def round5(self):
+        return self._round_teams(4)
+
+    @property
+    def round6(self):
+        return self._teams(self.winners[ROUND_SLICES[4]])
+
+    @property
+    def winner(self):
+        return self.team(self.winners[62])
+
+    def _round_teams(self, round_number):
+        # Teams that won a game in `round_number`, grouped by region
+        # in the same order as `Bracket`
+        n_games = 16 >> round_number
+        columns = [_region_column(self.field.regions.index(region), round_number, j)
+                   for region in REGION_NAMES for j in range(n_games)]
+        return self._teams(self.winners[columns])
+
+    @property
+    def Finals(self):
+        return _FinalsView(self)
+
+    def __getattr__(self, name):
+        if name in REGION_NAMES:
+            return _RegionView(self, name)
+        raise AttributeError(f"'CompactBracket' object has no attribute '{name}'")
+
+    def to_bracket(self):
+        """
+        Materialize a full simulated `Bracket` with the same results
+        """
+        round_winners = {round_number: {self.field.names[i] for i in self.winners[games]}
+                         for round_number, games in enumerate(ROUND_SLICES, start=1)}
+
+        def sim_func(the_game):
+            if the_game.top_team.name in round_winners[the_game.round_number]:
+                return the_game.top_team
+            return the_game.bottom_team
+
+        bracket = Bracket.from_field(self.field)
+        bracket.sim(sim_func)
+        return bracket
+
+    def __repr__(self):
+        return f"<CompactBracket {self.year}: winner {self.winner}>"
+
+class _RegionView():
+    """
+    Read-only view of one region of a `CompactBracket`, with the same
+    attributes as a simulated `SubBracket16`
+    """
+    __slots__ = ('bracket', 'region', 'position')
+
+    def __init__(self, bracket, region):
+        self.bracket = bracket
+        self.region = region
+        self.position = bracket.field.regions.index(region)
+
+    @property
+    def teams(self):
+        k = self.position
+        seeds = self.bracket.field.seeds
+        return self.bracket._teams(sorted(range(k * 16, (k + 1) * 16), key=seeds.__getitem__))
+
+    def game(self, number):
+        """
+        Materialize game `number` (1-15) of the region, numbered like `SubBracket16`
+        """
+        if not 1 <= number <= 15:
+            raise ValueError("number must be between 1 and 15")
+        round_number, j = 1, number - 1
+        while j >= 16 >> round_number:
+            j -= 16 >> round_number
+            round_number += 1
+        if round_number == 1:
+            top = self.position * 16 + 2 * j
+            bottom = top + 1
+        else:
+            winners = self.bracket.winners
+            top = winners[_region_column(self.position, round_number - 1, 2 * j)]
+            bottom = winners[_region_column(self.position, round_number - 1, 2 * j + 1)]
+        return Game(self.bracket.team(top), self.bracket.team(bottom), round_number)
+
+    @property
+    def round1(self):
+        return [self.game(n) for n in range(1, 9)]
+
+    @property
+    def round2(self):
+        return [self.game(n) for n in range(9, 13)]
+
+    @property
+    def round3(self):
+        return [self.game(n) for n in range(13, 15)]
+
+    @property
+    def round4(self):
+        return [self.game(15)]
+
+    @property
+    def winner(self):
+        return self.bracket.team(self.bracket.winners[_region_column(self.position, 4, 0)])
+
+    def __getattr__(self, name):
+        if name.startswith('Game') and name[4:].isdigit():
+            return self.game(int(name[4:]))
+        if name.startswith('team') and name[4:].isdigit():
+            seed = int(name[4:])
+            return self.teams[seed - 1]
+        raise AttributeError(f"'_RegionView' object has no attribute '{name}'")
+
+    def __repr__(self):
+        return f"<{self.region} Region of {self.bracket}>"
+
+class _FinalsView():
+    """
+    Read-only view of the final four of a `CompactBracket`, with the same
+    attributes as a simulated `FinalFour`
+    """
+    __slots__ = ('bracket',)
+
+    def __init__(self, bracket):
+        self.bracket = bracket
+
+    @property
+    def Game1(self):
+        winners = self.bracket.winners
+        return Game(self.bracket.team(winners[56]), self.bracket.team(winners[57]), 5)
+
+    @property
+    def Game2(self):
+        winners = self.bracket.winners
+        return Game(self.bracket.team(winners[58]), self.bracket.team(winners[59]), 5)
+
+    @property
+    def Championship(self):
+        winners = self.bracket.winners
+        return Game(self.bracket.team(winners[60]), self.bracket.team(winners[61]), 6)
+
+    @property
+    def winner(self):
+        return self.bracket.winner
+
+    def __repr__(self):
+        return f"<Finals of {self.bracket}>"
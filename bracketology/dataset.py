@@ -0,0 +1,72 @@
+import os
+from functools import lru_cache
+
+# json and pickle are imported inside the functions below, and
+# importlib.resources only when the package is not a plain directory
+# (e.g. a zip). They add tens of milliseconds to `import bracketology`.
+
+JSON_FILE = 'brackets.json'
+SNAPSHOT_FILE = 'brackets.pickle'
+
+_DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+def _read_data_file(name):
+    # Returns the contents of a file in the data directory, or None if
+    # the file does not exist
+    if os.path.isdir(_DATA_DIR):
+        path = os.path.join(_DATA_DIR, name)
+        if not os.path.isfile(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    from importlib import resources
+    resource = resources.files('bracketology').joinpath('data', name)
+    return resource.read_bytes() if resource.is_file() else None
+
+def _fingerprint(data):
+    # Identifies the contents of the JSON a snapshot was made from
+    import zlib
+    return len(data), zlib.crc32(data)
+
+@lru_cache(maxsize=None)
+def load_brackets():
+    """
+    Load the tournament data for every year, keyed by year as a string.
+
+    The data is read the first time it is needed rather than when
+    bracketology is imported. If a snapshot written by `write_snapshot` sits
+    next to ``data/brackets.json`` and was made from the same JSON, it is
+    loaded instead, which skips parsing the JSON. A snapshot of an older
+    JSON (e.g. left behind by an upgrade) is ignored.
+
+    Returns
+    -------
+    brackets_dict : dict
+        The ``Region``, ``Results`` and ``Finals`` data of each year
+    """
+    data = _read_data_file(JSON_FILE)
+    snapshot = _read_data_file(SNAPSHOT_FILE)
+    if snapshot is not None:
+        import pickle
+        try:
+            fingerprint, brackets_dict = pickle.loads(snapshot)
+        except (pickle.UnpicklingError, TypeError, ValueError, EOFError):
+            fingerprint = None
+        if fingerprint == _fingerprint(data):
+            return brackets_dict
+    import json
+    return json.loads(data)
+
+def write_snapshot():
+    """
+    Write a pickle snapshot of ``data/brackets.json`` next to it, that
+    `load_brackets` will use instead of the JSON for as long as the JSON
+    does not change.
+    """
+    import json
+    import pickle
+    data = _read_data_file(JSON_FILE)
+    snapshot = (_fingerprint(data), json.loads(data))
+    with open(os.path.join(_DATA_DIR, SNAPSHOT_FILE), 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    load_brackets.cache_clear()
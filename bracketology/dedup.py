@@ -0,0 +1,195 @@
+import numpy as np
+from bracketology.compact import CompactBracket, _region_column, pack_outcomes, unpack_outcomes
+from bracketology.engine import N_GAMES, ROUND_SLICES
+from bracketology.fields import get_field
+from bracketology.scoring import SCORING_SYSTEMS, _ROUND_INDICATOR, actual_winners
+from bracketology.streaming import RunningStats
+
+# Games of each region in the order of the bits of a region code, the
+# region's final is last
+REGION_GAMES = np.array([[_region_column(k, round_number, j)
+                          for round_number in range(1, 5) for j in range(16 >> round_number)]
+                         for k in range(4)], dtype=np.uint64)
+_REGION_BITS = np.arange(REGION_GAMES.shape[1], dtype=np.uint64)
+_FINAL_FOUR = ROUND_SLICES[4]
+
+def count_unique(winners):
+    """
+    The distinct brackets among many, with how often each appears.
+
+    Each bracket is reduced to its 63-bit outcome code (see
+    `bracketology.compact.pack_outcomes`), which identifies it exactly.
+
+    Parameters
+    ----------
+    winners : numpy.ndarray
+        Array of shape (n, 63) of winners
+
+    Returns
+    -------
+    codes : numpy.ndarray
+        Sorted outcome codes of the distinct brackets
+    counts : numpy.ndarray
+        How many times each one appears
+    """
+    return np.unique(pack_outcomes(np.atleast_2d(winners)), return_counts=True)
+
+def region_codes(codes, k):
+    """
+    The 15-bit code of the results of region ``k`` of each bracket, the
+    bits of its games in the order of `REGION_GAMES`
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    # The region's games of each round are consecutive bits of the code
+    region = np.zeros(codes.shape, dtype=np.uint64)
+    offset = 0
+    for round_number in range(1, 5):
+        n_games = 16 >> round_number
+        start = _region_column(k, round_number, 0)
+        region |= ((codes >> np.uint64(start)) & np.uint64((1 << n_games) - 1)) << np.uint64(offset)
+        offset += n_games
+    return region.astype(np.uint16)
+
+def score_codes(year, codes, scoring='standard'):
+    """
+    Score brackets given as outcome codes, like
+    `bracketology.scoring.score_brackets`.
+
+    Most brackets share their regions' results with many others, so the
+    15 games of each region are scored once per distinct region result
+    and only the final four and championship per bracket.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    codes : numpy.ndarray
+        Outcome codes of the brackets
+    scoring : function or str, optional
+        Scoring system, see `bracketology.scoring.score_brackets`
+
+    Returns
+    -------
+    n_correct_by_round : numpy.ndarray
+        Array of shape (n, 6), number of games correct in each round
+    total_score : numpy.ndarray
+        Array of shape (n,), total points of each bracket
+    """
+    if isinstance(scoring, str):
+        scoring = SCORING_SYSTEMS[scoring]
+    codes = np.atleast_1d(np.asarray(codes, dtype=np.uint64))
+    results = actual_winners(year)
+    points = scoring(get_field(year), results).astype(np.int64)
+    indicator = _ROUND_INDICATOR.astype(np.int64)
+
+    n_correct_by_round = np.zeros((len(codes), 6), dtype=np.int64)
+    total_score = np.zeros(len(codes), dtype=np.int64)
+    region_winners = np.empty((len(codes), 4), dtype=np.uint8)
+    for k, games in enumerate(REGION_GAMES):
+        unique, inverse = np.unique(region_codes(codes, k), return_inverse=True)
+        # A code with only this region's bits unpacks to the region's results
+        region_only = (((unique[:, None].astype(np.uint64) >> _REGION_BITS) & np.uint64(1)) << games).sum(axis=1)
+        columns = games.astype(np.intp)
+        winners = unpack_outcomes(region_only)[:, columns]
+        correct = (winners == results[columns]).astype(np.int64)
+        n_correct_by_round += (correct @ indicator[columns])[inverse]
+        total_score += (correct @ points[columns])[inverse]
+        region_winners[:, k] = winners[:, -1][inverse]
+
+    bits = (codes[:, None] >> np.arange(_FINAL_FOUR.start, N_GAMES, dtype=np.uint64)) & np.uint64(1)
+    finals = np.empty((len(codes), 3), dtype=np.uint8)
+    finals[:, 0] = np.where(bits[:, 0] == 1, region_winners[:, 1], region_winners[:, 0])
+    finals[:, 1] = np.where(bits[:, 1] == 1, region_winners[:, 3], region_winners[:, 2])
+    finals[:, 2] = np.where(bits[:, 2] == 1, finals[:, 1], finals[:, 0])
+    correct = (finals == results[_FINAL_FOUR.start:]).astype(np.int64)
+    n_correct_by_round += correct @ indicator[_FINAL_FOUR.start:]
+    total_score += correct @ points[_FINAL_FOUR.start:]
+    return n_correct_by_round, total_score
+
+class UniqueBrackets():
+    """
+    Counts of the distinct brackets in a stream of simulations, so each
+    one only has to be scored once. Has an ``update(winners)`` method like
+    the aggregators in `bracketology.streaming`.
+
+    Attributes
+    ----------
+    codes : numpy.ndarray
+        Sorted outcome codes of the distinct brackets seen
+    counts : numpy.ndarray
+        How many times each one was seen
+    n : int
+        Number of brackets seen
+    """
+    def __init__(self, year):
+        self.year = year
+        self.codes = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.int64)
+        self.n = 0
+
+    def update(self, winners):
+        codes, counts = count_unique(winners)
+        return self.add_codes(codes, counts)
+
+    def add_codes(self, codes, counts=None):
+        """
+        Add brackets given as outcome codes, each seen `counts` times
+        (once by default)
+        """
+        codes = np.asarray(codes, dtype=np.uint64)
+        counts = np.ones(len(codes), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        codes, inverse = np.unique(codes, return_inverse=True)
+        counts = np.bincount(inverse.ravel(), weights=counts, minlength=len(codes)).astype(np.int64)
+
+        # Both arrays are sorted, so new codes are found or slotted in
+        # without sorting everything seen so far again
+        position = np.searchsorted(self.codes, codes)
+        found = position < len(self.codes)
+        found[found] = self.codes[position[found]] == codes[found]
+        self.counts[position[found]] += counts[found]
+        self.codes = np.insert(self.codes, position[~found], codes[~found])
+        self.counts = np.insert(self.counts, position[~found], counts[~found])
+        self.n += int(counts.sum())
+        return self
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __repr__(self):
+        return f"<UniqueBrackets {self.year} n={self.n} unique={len(self)}>"
+
+    def winners(self):
+        """
+        Winners of each distinct bracket, an array of shape (n_unique, 63)
+        """
+        return unpack_outcomes(self.codes)
+
+    def score(self, scoring='standard'):
+        """
+        Score each distinct bracket once, see `score_codes`
+        """
+        return score_codes(self.year, self.codes, scoring)
+
+    def score_stats(self, scoring='standard'):
+        """
+        Statistics of the scores of every bracket seen, weighting each
+        distinct bracket by its count
+
+        Returns
+        -------
+        total_score : RunningStats
+            Statistics of the total score
+        n_games_correct : RunningStats
+            Statistics of the number of games correct
+        """
+        n_correct_by_round, total_score = self.score(scoring)
+        return (RunningStats().update(total_score, self.counts),
+                RunningStats().update(n_correct_by_round.sum(axis=1), self.counts))
+
+    def most_common(self, k=10):
+        """
+        The `k` brackets seen the most, as a list of (CompactBracket, count)
+        """
+        order = np.argsort(-self.counts, kind='stable')[:k]
+        return [(CompactBracket.from_code(self.year, self.codes[i]), int(self.counts[i]))
+                for i in order]
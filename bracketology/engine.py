@@ -0,0 +1,181 @@
+import numpy as np
+from bracketology.fields import get_field
+
+N_TEAMS = 64
+N_GAMES = 63
+
+# Columns of the winner matrix for each round. Games are numbered from the
+# top of the bracket to the bottom within a round, so the two games feeding
+# game ``j`` of the next round are games ``2j`` and ``2j + 1`` of this round
+ROUND_SLICES = (slice(0, 32), slice(32, 48), slice(48, 56),
+                slice(56, 60), slice(60, 62), slice(62, 63))
+
+# Round number (1-6) of each of the 63 games
+ROUND_OF_GAME = np.repeat(np.arange(1, 7, dtype=np.int8), [32, 16, 8, 4, 2, 1])
+
+def _game_tree():
+    parent = np.full(N_GAMES, -1, dtype=np.int64)
+    children = np.full((N_GAMES, 2), -1, dtype=np.int64)
+    for prev, games in zip(ROUND_SLICES, ROUND_SLICES[1:]):
+        for j, game in enumerate(range(games.start, games.stop)):
+            children[game] = (prev.start + 2 * j, prev.start + 2 * j + 1)
+            parent[children[game]] = game
+    return parent, children
+
+# The game each game's winner plays in next (-1 for the championship), and
+# the two games that feed each game (-1 for first round games)
+PARENT_GAME, CHILD_GAMES = _game_tree()
+
+def simulate(year, n_sims, win_prob, rng=None, chunk_size=2**16, fixed=None, draws=None):
+    """
+    Simulate many full brackets at once with array operations.
+
+    Each simulated bracket is one row of 63 winners, the index of the winning
+    team in the `Field` for that year. The columns are the games in
+    `ROUND_SLICES` order, so column 62 is the champion.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    n_sims : int
+        Number of brackets to simulate
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Either a 64x64 matrix where ``win_prob[i, j]`` is the probability
+        that team ``i`` beats team ``j``, a batch function like
+        `bracketology.simulators.upset_prob_batch` that takes
+        ``(field, top, bottom, round_number)`` and returns the probability
+        that each top team wins, or a
+        `bracketology.probability.ProbabilityModel`
+    rng : numpy.random.Generator or int, optional
+        Random number generator, or a seed to create one
+    chunk_size : int, optional
+        Number of brackets to simulate at a time, bounds memory use
+    fixed : array-like or dict, optional
+        Results that are already known, see `as_fixed`. Only the other
+        games are simulated, and rounds that are completely known are
+        filled in without drawing any random numbers
+    draws : numpy.ndarray, optional
+        Array of shape (n_sims, 63) of uniform random numbers to use instead
+        of `rng`, one per game. The top team wins game ``g`` of bracket ``i``
+        when ``draws[i, g]`` is below its win probability, so simulating
+        different models with the same draws gives common random numbers
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        Array of shape (n_sims, 63) with the winning team of each game
+    """
+    field = get_field(year)
+    rng = np.random.default_rng(rng)
+    win_prob = as_win_prob(year, win_prob)
+    if fixed is not None:
+        fixed = as_fixed(fixed)
+    if draws is not None and draws.shape != (n_sims, N_GAMES):
+        raise ValueError("draws must have shape (n_sims, 63)")
+
+    winners = np.empty((n_sims, N_GAMES), dtype=np.uint8)
+    for start in range(0, n_sims, chunk_size):
+        stop = min(start + chunk_size, n_sims)
+        chunk_draws = None if draws is None else draws[start:stop]
+        _simulate_chunk(field, win_prob, rng, winners[start:stop], fixed, chunk_draws)
+    return winners
+
+def as_win_prob(year, win_prob):
+    """
+    Check a `win_prob` argument (see `simulate`), returning either a batch
+    function or a 64x64 matrix. Probability models are replaced by their
+    cached matrix for `year`.
+    """
+    if hasattr(win_prob, 'matrix'):
+        return win_prob.matrix(year)
+    if callable(win_prob):
+        return win_prob
+    win_prob = np.asarray(win_prob, dtype=np.float64)
+    if win_prob.shape != (N_TEAMS, N_TEAMS):
+        raise ValueError("win_prob must be a 64x64 matrix, a function or a ProbabilityModel")
+    return win_prob
+
+def as_fixed(fixed):
+    """
+    Check a set of known results, filling in the earlier games they imply.
+
+    If a team is known to have won a game, it also won every earlier game
+    on its way there, so those are fixed too.
+
+    Parameters
+    ----------
+    fixed : array-like or dict
+        Either 63 entries with the winning team index of each known game
+        and -1 for games still to be played, or a dict of
+        ``{game: winning team index}``
+
+    Returns
+    -------
+    fixed : numpy.ndarray
+        Array of 63 winners with -1 for unknown games
+    """
+    if isinstance(fixed, dict):
+        games = fixed
+        fixed = np.full(N_GAMES, -1, dtype=np.int16)
+        for game, winner in games.items():
+            fixed[game] = winner
+    else:
+        fixed = np.array(fixed, dtype=np.int16)
+        if fixed.shape != (N_GAMES,):
+            raise ValueError("fixed must have one entry for each of the 63 games")
+
+    for game in range(N_GAMES - 1, -1, -1):
+        winner = int(fixed[game])
+        if winner < 0:
+            continue
+        round_number = int(ROUND_OF_GAME[game])
+        if not 0 <= winner < N_TEAMS or winner >> round_number != game - ROUND_SLICES[round_number - 1].start:
+            raise ValueError(f"team {winner} can not win game {game}")
+        if round_number > 1:
+            # The game the winner played in the round before
+            child = ROUND_SLICES[round_number - 2].start + (winner >> (round_number - 1))
+            if fixed[child] >= 0 and fixed[child] != winner:
+                raise ValueError(f"team {winner} wins game {game} but lost game {child}")
+            fixed[child] = winner
+    return fixed
+
+def _simulate_chunk(field, win_prob, rng, out, fixed=None, draws=None):
+    n = len(out)
+    alive = np.broadcast_to(np.arange(N_TEAMS, dtype=np.uint8), (n, N_TEAMS))
+    for round_number, games in enumerate(ROUND_SLICES, start=1):
+        top = alive[:, 0::2]
+        bottom = alive[:, 1::2]
+        if fixed is None:
+            free = slice(None)
+        else:
+            known = fixed[games]
+            free = np.flatnonzero(known < 0)
+            if len(free) == len(known):
+                free = slice(None)
+            elif len(free) == 0:
+                # The whole round is known, the same for every bracket
+                alive = np.broadcast_to(known.astype(np.uint8), (n, len(known)))
+                out[:, games] = alive
+                continue
+            else:
+                top = top[:, free]
+                bottom = bottom[:, free]
+
+        if callable(win_prob):
+            p_top = win_prob(field, top, bottom, round_number)
+        else:
+            p_top = win_prob[top, bottom]
+        if draws is None:
+            uniform = rng.random(top.shape, dtype=np.float32)
+        else:
+            uniform = draws[:, games][:, free]
+        picked = np.where(uniform < p_top, top, bottom)
+
+        if isinstance(free, slice):
+            alive = picked
+        else:
+            alive = np.empty((n, len(known)), dtype=np.uint8)
+            alive[:] = known.astype(np.uint8)
+            alive[:, free] = picked
+        out[:, games] = alive
@@ -0,0 +1,128 @@
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from bracketology.brackets import Team
+from bracketology.dataset import load_brackets
+
+# Keys of the actual results for the teams that won a game in rounds 1-5
+RESULT_ROUNDS = ('second', 'sweet16', 'elite8', 'final4', 'championship')
+
+# Seeds of a 16 team region from the top of the bracket to the bottom.
+# Adjacent seeds meet in the first round, same pairings as `SubBracket16`
+SEED_ORDER = (1, 16, 8, 9, 5, 12, 4, 13, 6, 11, 3, 14, 7, 10, 2, 15)
+
+# Read-only ``Team.stats`` of the shared teams, until stats are attached
+_NO_STATS = MappingProxyType({})
+
+class Field():
+    """
+    The 64 teams of a NCAA tournament laid out in bracket order.
+
+    Team ``i`` plays team ``i ^ 1`` in the first round, and the winners
+    of neighbouring games keep meeting each other all the way up to the
+    championship. So the top team of every game always has the lower index.
+
+    Attributes
+    ----------
+    year : str
+        Calendar year of the tournament
+    regions : tuple of str
+        Region names in bracket order. The first two regions meet in one
+        final four game and the last two in the other
+    names : tuple of str
+        Name of each of the 64 teams, in bracket order
+    seeds : numpy.ndarray
+        Seed of each of the 64 teams, in bracket order
+    index : dict
+        Position of each team in the field, keyed by team name
+    teams : tuple of Team
+        The `Team` of each position in the field. These are shared by every
+        `Bracket` built from the field, their ``stats`` is an empty read-only
+        mapping until `bracketology.stats.StatsStore.attach` sets it
+    region_teams : dict
+        Tuple of the teams in each region, ordered by seed
+    final_matches : dict
+        Which regions meet in each final four game (the ``Finals`` data)
+    regions_data : dict
+        The teams that year broken down by region (the ``Region`` data)
+    result : dict
+        The actual tournament results for that year
+    result_sets : dict
+        Names of the teams that actually won a game in rounds 1-5, keyed
+        like `result` by the round they advanced to
+    result_winner : str
+        Name of the actual tournament winner
+    """
+    def __init__(self, year):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        """
+        self.year = str(year)
+        bracket = load_brackets().get(self.year)
+        if bracket is None:
+            raise ValueError("Year must be between 1985 and 2019")
+
+        finals = bracket['Finals']
+        self.final_matches = finals
+        self.regions = (finals['game1']['team1'], finals['game1']['team2'],
+                        finals['game2']['team1'], finals['game2']['team2'])
+
+        self.region_teams = {}
+        teams = []
+        for region in self.regions:
+            region_teams = tuple(Team(name=team['Team'], seed=team['Seed'])
+                                 for team in bracket['Region'][region])
+            for team in region_teams:
+                team.stats = _NO_STATS
+            by_seed = {team.seed: team for team in region_teams}
+            teams.extend(by_seed[seed] for seed in SEED_ORDER)
+            self.region_teams[region] = region_teams
+        self.teams = tuple(teams)
+        self.names = tuple(team.name for team in self.teams)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        self.result = bracket['Results']
+        self.result_sets = {key: frozenset(team['Team'] for team in self.result[key])
+                            for key in RESULT_ROUNDS}
+        self.result_winner = self.result['winner']['Team']
+        self.regions_data = bracket['Region']
+
+    @cached_property
+    def seeds(self):
+        # numpy is only imported once the batch tools need it, so that
+        # building a plain `Bracket` does not pay for it
+        import numpy as np
+        return np.array([team.seed for team in self.teams], dtype=np.int8)
+
+    @cached_property
+    def topology(self):
+        """
+        The `bracketology.topology.Topology` of the field, 64 slots in four
+        regions with no play-ins. Its games are numbered the same way as the
+        columns of `bracketology.engine.simulate`
+        """
+        from bracketology.topology import Topology
+        return Topology(len(self.names), region_names=self.regions)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"<Field {self.year}: {len(self)} teams>"
+
+def get_field(year):
+    """
+    Get the `Field` for a year. Fields are built once and then shared.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    """
+    return _cached_field(int(year))
+
+@lru_cache(maxsize=None)
+def _cached_field(year):
+    return Field(year)
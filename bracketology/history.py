@@ -0,0 +1,202 @@
+from collections import defaultdict
+from functools import lru_cache
+import numpy as np
+from bracketology.engine import N_GAMES, ROUND_OF_GAME
+from bracketology.fields import get_field
+from bracketology.scoring import actual_winners, game_teams
+
+YEARS = range(1985, 2020)
+
+# Region of the final four and championship games
+FINAL_FOUR = 'Final Four'
+
+class GameTable():
+    """
+    Every game of the 1985-2019 tournaments as one table, one row per game.
+
+    Rows are in year order, and within a year in the same game order as
+    `bracketology.engine.simulate`. The columns are a NumPy structured array
+    in `games`:
+
+    ``year``, ``round``, ``game``
+        Year, round number (1-6) and game index (0-62)
+    ``region``
+        Region of the game, ``'Final Four'`` for the last two rounds
+    ``top_team``, ``bottom_team``, ``top_seed``, ``bottom_seed``
+        The two teams, the top team being the one higher in the bracket
+    ``winner``, ``winner_seed``, ``loser``, ``loser_seed``
+        Who won and lost
+    ``upset``
+        True if the winner had the worse (higher) seed
+
+    Row indices by seed pair, team and round are built once, so base rate
+    questions are dictionary lookups.
+    """
+    def __init__(self, years=YEARS):
+        """
+        Parameters
+        ----------
+        years : iterable of int, optional
+            Years to include, the default is every year
+        """
+        fields = [get_field(year) for year in years]
+        name_dtype = f"U{max(len(name) for field in fields for name in field.names)}"
+        region_dtype = f"U{max(len(FINAL_FOUR), *(len(region) for field in fields for region in field.regions))}"
+        dtype = np.dtype([('year', np.int16), ('round', np.int8), ('game', np.int8),
+                          ('region', region_dtype),
+                          ('top_team', name_dtype), ('bottom_team', name_dtype),
+                          ('top_seed', np.int8), ('bottom_seed', np.int8),
+                          ('winner', name_dtype), ('winner_seed', np.int8),
+                          ('loser', name_dtype), ('loser_seed', np.int8),
+                          ('upset', bool)])
+        games = np.empty(len(fields) * N_GAMES, dtype=dtype)
+        for k, field in enumerate(fields):
+            rows = games[k * N_GAMES:(k + 1) * N_GAMES]
+            winners = actual_winners(field.year)
+            top, bottom = (teams[0] for teams in game_teams(winners))
+            loser = np.where(winners == top, bottom, top)
+            names = np.array(field.names)
+            seeds = field.seeds
+            regions = np.array(field.regions + (FINAL_FOUR,))
+            rows['year'] = int(field.year)
+            rows['round'] = ROUND_OF_GAME
+            rows['game'] = np.arange(N_GAMES)
+            rows['region'] = regions[np.where(ROUND_OF_GAME <= 4, top >> 4, 4)]
+            rows['top_team'], rows['bottom_team'] = names[top], names[bottom]
+            rows['top_seed'], rows['bottom_seed'] = seeds[top], seeds[bottom]
+            rows['winner'], rows['winner_seed'] = names[winners], seeds[winners]
+            rows['loser'], rows['loser_seed'] = names[loser], seeds[loser]
+        games['upset'] = games['winner_seed'] > games['loser_seed']
+        games.setflags(write=False)
+        self.games = games
+
+        self._by_seeds = _group(zip(np.minimum(games['top_seed'], games['bottom_seed']).tolist(),
+                                    np.maximum(games['top_seed'], games['bottom_seed']).tolist()))
+        self._by_round = _group(games['round'].tolist())
+        self._by_year = _group(games['year'].tolist())
+        by_team = defaultdict(list)
+        for i, (top, bottom) in enumerate(zip(games['top_team'].tolist(), games['bottom_team'].tolist())):
+            by_team[top].append(i)
+            by_team[bottom].append(i)
+        self._by_team = {name: np.array(rows, dtype=np.intp) for name, rows in by_team.items()}
+
+    def __len__(self):
+        return len(self.games)
+
+    def select(self, seeds=None, team=None, round_number=None, year=None):
+        """
+        The games matching every given condition.
+
+        Parameters
+        ----------
+        seeds : tuple of int, optional
+            Games between these two seeds, in either order
+        team : str, optional
+            Games the team played in
+        round_number : int, optional
+            Games of this round
+        year : int, optional
+            Games of this year
+
+        Returns
+        -------
+        games : numpy.ndarray
+            The matching rows of `games`
+        """
+        return self.games[self._rows(seeds, team, round_number, year)]
+
+    def _rows(self, seeds=None, team=None, round_number=None, year=None):
+        conditions = []
+        if seeds is not None:
+            conditions.append(self._by_seeds.get((min(seeds), max(seeds)), _NO_ROWS))
+        if team is not None:
+            conditions.append(self._by_team.get(team, _NO_ROWS))
+        if round_number is not None:
+            conditions.append(self._by_round.get(round_number, _NO_ROWS))
+        if year is not None:
+            conditions.append(self._by_year.get(int(year), _NO_ROWS))
+        if not conditions:
+            return np.arange(len(self.games))
+        rows = conditions[0]
+        for other in conditions[1:]:
+            rows = np.intersect1d(rows, other, assume_unique=True)
+        return rows
+
+    def seed_record(self, seed, opponent_seed, round_number=None):
+        """
+        How often a seed beat another seed, e.g. ``seed_record(12, 5)`` for
+        how often 12 seeds beat 5 seeds. The two seeds must differ, a seed
+        always wins its games against itself.
+
+        Parameters
+        ----------
+        seed : int
+            Seed to count the wins of
+        opponent_seed : int
+            Seed of its opponents
+        round_number : int, optional
+            Only count games of this round
+
+        Returns
+        -------
+        wins : int
+            Number of games `seed` won
+        games : int
+            Number of games between the two seeds
+        """
+        if seed == opponent_seed:
+            raise ValueError(f"seed and opponent_seed are both {seed}, a seed has no "
+                             "record against itself")
+        games = self.select(seeds=(seed, opponent_seed), round_number=round_number)
+        return int(np.count_nonzero(games['winner_seed'] == seed)), len(games)
+
+    def seed_win_rates(self, round_number=None):
+        """
+        Win and game counts of every seed against every other seed.
+
+        Parameters
+        ----------
+        round_number : int, optional
+            Only count games of this round
+
+        Returns
+        -------
+        wins : numpy.ndarray
+            Array of shape (17, 17), ``wins[a, b]`` is the number of times
+            seed ``a`` beat seed ``b`` (index 0 is unused)
+        games : numpy.ndarray
+            Array of shape (17, 17), the number of games between the seeds
+        """
+        games = self.games if round_number is None else self.select(round_number=round_number)
+        wins = np.zeros((17, 17), dtype=np.int64)
+        np.add.at(wins, (games['winner_seed'], games['loser_seed']), 1)
+        n_games = wins + wins.T
+        # A game between equal seeds is one win on the diagonal, not two
+        np.fill_diagonal(n_games, np.diagonal(wins))
+        return wins, n_games
+
+    def to_frame(self):
+        """
+        The table as a `pandas.DataFrame`. Requires pandas
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("GameTable.to_frame requires pandas") from None
+        return pd.DataFrame(self.games)
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+def _group(keys):
+    # Row indices of each distinct key
+    groups = defaultdict(list)
+    for i, key in enumerate(keys):
+        groups[key].append(i)
+    return {key: np.array(rows, dtype=np.intp) for key, rows in groups.items()}
+
+@lru_cache(maxsize=1)
+def game_table():
+    """
+    The `GameTable` of every year, built the first time it is needed
+    """
+    return GameTable()
@@ -0,0 +1,104 @@
+import numpy as np
+from bracketology.engine import N_GAMES, ROUND_OF_GAME, ROUND_SLICES, as_fixed
+from bracketology.fields import get_field
+from bracketology.scoring import actual_winners
+
+def known_results(year, through_round=None, games=None):
+    """
+    Actual results of some games of a past tournament, in the form the
+    `fixed` argument of `bracketology.engine.simulate` takes. Useful for
+    replaying a tournament as it happened.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    through_round : int, optional
+        Keep the results of every game up to and including this round
+    games : iterable of int, optional
+        Keep the results of these games (columns of the winner array)
+
+    Returns
+    -------
+    fixed : numpy.ndarray
+        Array of 63 winners with -1 for the games that are not kept
+    """
+    results = actual_winners(year)
+    keep = np.zeros(N_GAMES, dtype=bool)
+    if through_round is not None:
+        keep |= ROUND_OF_GAME <= through_round
+    if games is not None:
+        keep[list(games)] = True
+    return as_fixed(np.where(keep, results.astype(np.int16), -1))
+
+def fix_game(fixed, year, winner):
+    """
+    Record the result of one game, given the name of the team that won it.
+    The game is the next one the team had not been known to win.
+
+    Parameters
+    ----------
+    fixed : numpy.ndarray
+        Known results so far, 63 entries with -1 for unknown games. Updated in place
+    year : int
+        Year of the NCAA tournament
+    winner : str
+        Name of the team that won
+
+    Returns
+    -------
+    fixed : numpy.ndarray
+        The updated results
+    """
+    team = get_field(year).index[winner]
+    for round_number, games in enumerate(ROUND_SLICES, start=1):
+        game = games.start + (team >> round_number)
+        if fixed[game] < 0:
+            fixed[game] = team
+            return fixed
+        if fixed[game] != team:
+            raise ValueError(f"{winner} already lost game {game}")
+    raise ValueError(f"{winner} already won the championship")
+
+class LockedSimFunc():
+    """
+    A simulator function for `Bracket` that returns the known winner of
+    games that have been played and only calls `sim_func` for the others.
+    """
+    def __init__(self, year, fixed, sim_func):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        fixed : array-like or dict
+            Known results, see `bracketology.engine.as_fixed`
+        sim_func : function
+            A function that take in `Game` and returns a `Team` of that Game,
+            used for the games that have not been played
+        """
+        field = get_field(year)
+        self.index = field.index
+        self.teams = field.teams
+        self.fixed = as_fixed(fixed).tolist()
+        self.sim_func = sim_func
+
+    def rebind_rng(self, rng):
+        """
+        A copy that draws the games still to be played from `rng`, see
+        `bracketology.simulators.rebind_rng`
+        """
+        from bracketology.simulators import rebind_rng
+        rebound = LockedSimFunc.__new__(LockedSimFunc)
+        rebound.__dict__.update(self.__dict__)
+        rebound.sim_func = rebind_rng(self.sim_func, rng)
+        return rebound
+
+    def __call__(self, the_game):
+        round_number = the_game.round_number
+        top = self.index[the_game.top_team.name]
+        game = ROUND_SLICES[round_number - 1].start + (top >> round_number)
+        winner = self.fixed[game]
+        if winner < 0:
+            return self.sim_func(the_game)
+        return self.teams[winner]
@@ -0,0 +1,266 @@
+import math
+import numpy as np
+from bracketology.engine import (N_GAMES, ROUND_OF_GAME, ROUND_SLICES, PARENT_GAME,
+                                 CHILD_GAMES, simulate)
+from bracketology.probability import advancement_probabilities
+from bracketology.scoring import ROUND_POINTS
+
+def best_expected_bracket(year, win_prob, points=ROUND_POINTS):
+    """
+    The bracket with the highest expected score, found exactly.
+
+    The expected score of a bracket is the sum over its picks of the points
+    for the round times the probability that the picked team wins that
+    round, so the best bracket can be found by working up the bracket,
+    keeping the best value of each game's subtree for each team that could
+    be picked to win it.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Same as for `bracketology.engine.simulate`
+    points : array-like, optional
+        Points for a correct pick in each round, indexed by round number
+        (index 0 is unused). The default is 1, 2, 4, 8, 16, 32
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        The picked winner of each of the 63 games
+    expected_score : float
+        Expected score of the bracket
+    """
+    advance = advancement_probabilities(year, win_prob)
+    n_teams = advance.shape[0]
+    values = []
+    value = np.zeros(n_teams)
+    for round_number in range(1, 7):
+        half = 1 << (round_number - 1)
+        blocks = value.reshape(-1, 2, half)
+        best_other = blocks.max(axis=2)[:, ::-1, None]
+        value = (blocks + best_other).reshape(n_teams) + points[round_number] * advance[:, round_number - 1]
+        values.append(value)
+
+    winners = np.empty(N_GAMES, dtype=np.uint8)
+    winners[N_GAMES - 1] = np.argmax(values[-1])
+    for round_number in range(6, 1, -1):
+        half = 1 << (round_number - 1)
+        for game in range(ROUND_SLICES[round_number - 1].start, ROUND_SLICES[round_number - 1].stop):
+            winner = int(winners[game])
+            top_game, bottom_game = CHILD_GAMES[game]
+            start = (winner // (2 * half)) * 2 * half
+            if winner < start + half:
+                other = start + half + np.argmax(values[round_number - 2][start + half:start + 2 * half])
+                winners[top_game], winners[bottom_game] = winner, other
+            else:
+                other = start + np.argmax(values[round_number - 2][start:start + half])
+                winners[top_game], winners[bottom_game] = other, winner
+    return winners, float(values[-1].max())
+
+class ExpectedScore():
+    """
+    Objective for `anneal`, the expected score of the bracket under a win
+    probability model. Changing a pick only changes the expected points of
+    the games whose pick changed.
+    """
+    default_temperature = (4.0, 0.01)
+
+    def __init__(self, year, win_prob, points=ROUND_POINTS):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        win_prob : numpy.ndarray, function or ProbabilityModel
+            Same as for `bracketology.engine.simulate`
+        points : array-like, optional
+            Points for a correct pick in each round, indexed by round number
+        """
+        advance = advancement_probabilities(year, win_prob)
+        round_points = np.asarray(points, dtype=np.float64)[ROUND_OF_GAME]
+        # Expected points of picking each team to win each game
+        self._game_values = (advance[:, ROUND_OF_GAME - 1] * round_points).T.tolist()
+        self.value = None
+
+    def reset(self, winners):
+        """
+        Evaluate a full bracket from scratch, returns its value
+        """
+        self.value = sum(self._game_values[game][winner] for game, winner in enumerate(winners))
+        return self.value
+
+    def propose(self, changes):
+        """
+        Value of the bracket after the picks in `changes`, a list of
+        ``(game, old_winner, new_winner)``, without committing to them
+        """
+        game_values = self._game_values
+        self._pending = self.value + sum(game_values[game][new] - game_values[game][old]
+                                         for game, old, new in changes)
+        return self._pending
+
+    def accept(self):
+        """
+        Commit the last proposed change
+        """
+        self.value = self._pending
+
+class PoolWinProbability():
+    """
+    Objective for `anneal`, the probability of having the best score in a
+    pool of simulated opponent brackets.
+
+    The tournament is simulated `n_sims` times, and the best opponent score
+    in each simulation is computed once. Changing a pick only rescores the
+    games whose pick changed, across all simulations at once. Ties count
+    as half a win.
+    """
+    default_temperature = (0.05, 0.0001)
+
+    def __init__(self, year, win_prob, n_opponents=100, n_sims=2000,
+                 opponent_win_prob=None, points=ROUND_POINTS, rng=None):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        win_prob : numpy.ndarray, function or ProbabilityModel
+            Model used to simulate the actual tournament
+        n_opponents : int, optional
+            Number of other brackets in the pool
+        n_sims : int, optional
+            Number of simulated tournaments
+        opponent_win_prob : numpy.ndarray, function or ProbabilityModel, optional
+            Model the opponents fill out their brackets with. The default is `win_prob`
+        points : array-like, optional
+            Points for a correct pick in each round, indexed by round number
+        rng : numpy.random.Generator or int, optional
+            Random number generator, or a seed to create one
+        """
+        rng = np.random.default_rng(rng)
+        if opponent_win_prob is None:
+            opponent_win_prob = win_prob
+        self.truths = simulate(year, n_sims, win_prob, rng=rng)
+        opponents = simulate(year, n_opponents, opponent_win_prob, rng=rng)
+        self.game_points = np.asarray(points, dtype=np.float64)[ROUND_OF_GAME]
+        game_points = self.game_points.astype(np.float32)
+        self.best_opponent = np.array([((opponents == truth).astype(np.float32) @ game_points).max()
+                                       for truth in self.truths])
+        self.scores = None
+        self.value = None
+
+    def _value(self, scores):
+        return np.mean(scores > self.best_opponent) + 0.5 * np.mean(scores == self.best_opponent)
+
+    def reset(self, winners):
+        self.scores = (self.truths == np.asarray(winners)).astype(np.float64) @ self.game_points
+        self.value = self._value(self.scores)
+        return self.value
+
+    def propose(self, changes):
+        scores = self.scores.copy()
+        for game, old, new in changes:
+            column = self.truths[:, game]
+            scores += self.game_points[game] * ((column == new).astype(np.float64) - (column == old))
+        self._pending = scores
+        return self._value(scores)
+
+    def accept(self):
+        self.scores = self._pending
+        self.value = self._value(self.scores)
+
+    reset.__doc__ = ExpectedScore.reset.__doc__
+    propose.__doc__ = ExpectedScore.propose.__doc__
+    accept.__doc__ = ExpectedScore.accept.__doc__
+
+def flip(winners, game):
+    """
+    Change the pick of one game to the other team in it, carrying the new
+    team forward through every later game the old pick was picked to win.
+    `winners` is a list and is changed in place.
+
+    Parameters
+    ----------
+    winners : list of int
+        Picked winner of each of the 63 games
+    game : int
+        Game to flip
+
+    Returns
+    -------
+    changes : list
+        ``(game, old_winner, new_winner)`` for every game whose pick changed
+    """
+    old = winners[game]
+    top_game, bottom_game = _CHILDREN[game]
+    if top_game < 0:
+        new = old ^ 1
+    else:
+        top, bottom = winners[top_game], winners[bottom_game]
+        new = bottom if old == top else top
+    changes = []
+    while game >= 0 and winners[game] == old:
+        winners[game] = new
+        changes.append((game, old, new))
+        game = _PARENTS[game]
+    return changes
+
+_PARENTS = PARENT_GAME.tolist()
+_CHILDREN = CHILD_GAMES.tolist()
+
+def anneal(objective, start, n_moves=100_000, temperature=None, rng=None):
+    """
+    Search for a better bracket by simulated annealing.
+
+    Each move flips the pick of a random game (see `flip`), and the
+    objective only re-evaluates the games whose pick changed. Moves that
+    improve the objective are always kept, and worse ones are kept with a
+    probability that shrinks as the temperature cools.
+
+    Parameters
+    ----------
+    objective : ExpectedScore or PoolWinProbability
+        What to maximize
+    start : array-like
+        Winners of the starting bracket, e.g. from `best_expected_bracket`
+    n_moves : int, optional
+        Number of moves to try
+    temperature : tuple of float, optional
+        Starting and final temperature, cooled geometrically. The default
+        is the objective's ``default_temperature``
+    rng : numpy.random.Generator or int, optional
+        Random number generator, or a seed to create one
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        The best bracket found
+    value : float
+        Its objective value
+    """
+    rng = np.random.default_rng(rng)
+    first, last = objective.default_temperature if temperature is None else temperature
+    cooling = (last / first) ** (1 / max(n_moves - 1, 1))
+
+    winners = [int(winner) for winner in start]
+    value = objective.reset(winners)
+    best, best_value = list(winners), value
+    games = rng.integers(0, N_GAMES, size=n_moves).tolist()
+    draws = rng.random(n_moves).tolist()
+    temp = first
+    for game, draw in zip(games, draws):
+        changes = flip(winners, game)
+        new_value = objective.propose(changes)
+        delta = new_value - value
+        if delta >= 0 or draw < math.exp(delta / temp):
+            objective.accept()
+            value = new_value
+            if value > best_value:
+                best, best_value = list(winners), value
+        else:
+            for changed, old, new in changes:
+                winners[changed] = old
+        temp *= cooling
+    return np.array(best, dtype=np.uint8), best_value
@@ -0,0 +1,193 @@
+import multiprocessing
+from functools import partial
+from multiprocessing import shared_memory
+import numpy as np
+from bracketology.backtest import YEARS, _mean_std
+from bracketology.engine import N_GAMES, N_TEAMS, ROUND_SLICES, _simulate_chunk
+from bracketology.fields import get_field
+from bracketology.probability import round_win_matrices
+from bracketology.scoring import SCORING_SYSTEMS, _ROUND_INDICATOR, actual_winners
+
+# Arrays each worker maps from shared memory when it starts, keyed by name
+_shared = {}
+
+def _create_shared(array):
+    # Copy an array into a new shared memory block
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+def _attach_worker(specs):
+    # Pool initializer, maps every shared array without copying it
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _shared[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+def _round_matrix_prob(matrices, field, top, bottom, round_number):
+    return matrices[round_number - 1][top, bottom]
+
+def _run_task(task):
+    # Simulate and score one range of trials, returning only sums
+    model, year_index, year, start, stop, seed = task
+    matrices = _shared['matrices'][1][model, year_index]
+    results = _shared['results'][1][year_index]
+    points = _shared['points'][1][year_index]
+    draws = _shared['draws'][1]
+
+    n = stop - start
+    winners = np.empty((n, N_GAMES), dtype=np.uint8)
+    win_prob = partial(_round_matrix_prob, matrices)
+    if stop <= len(draws):
+        _simulate_chunk(None, win_prob, None, winners, draws=draws[start:stop])
+    else:
+        rng = np.random.default_rng(np.random.SeedSequence([seed, year, start]))
+        _simulate_chunk(None, win_prob, rng, winners)
+
+    correct = (winners == results).astype(np.float32)
+    by_round = (correct @ _ROUND_INDICATOR).astype(np.int64)
+    metrics = np.column_stack([(correct @ points).astype(np.int64), by_round.sum(axis=1), by_round])
+    advancement = np.stack([np.bincount(winners[:, games].ravel(), minlength=N_TEAMS)
+                            for games in ROUND_SLICES], axis=1)
+    return year, n, metrics.sum(axis=0), (metrics * metrics).sum(axis=0), advancement
+
+class SimulationPool():
+    """
+    A pool of worker processes that keeps the data for many years and
+    models in shared memory, so tasks are tiny.
+
+    Everything a simulation needs is computed once and put in
+    `multiprocessing.shared_memory` when the pool starts: the win
+    probability matrices of every model and year, the actual results and
+    the points of each game, and a block of uniform random numbers. Workers
+    map these without copying. A task is only a model, a year and a range
+    of trials, and it sends back sums and counts rather than brackets, so
+    even small tasks keep every worker busy.
+
+    Trials inside the shared block of random numbers use the same numbers
+    for every model and year (common random numbers). Later trials draw
+    their own, seeded from the seed, year and first trial of the task.
+
+    Examples
+    --------
+    >>> with SimulationPool({'upsets': upset_prob_batch(0.2)}, years=[2018, 2019]) as pool:
+    ...     results = pool.run('upsets', n_trials=100_000)
+    """
+    def __init__(self, models, years=YEARS, workers=None, seed=0, n_draws=2**16,
+                 scoring='standard'):
+        """
+        Parameters
+        ----------
+        models : dict
+            Win probability models keyed by model id, anything
+            `bracketology.engine.simulate` takes as `win_prob`
+        years : iterable of int, optional
+            Years to load. The default is 1985-2019
+        workers : int, optional
+            Number of worker processes. The default is the number of CPUs
+        seed : int, optional
+            Seed for the random numbers
+        n_draws : int, optional
+            Number of trials of random numbers kept in shared memory
+        scoring : function or str, optional
+            Scoring system, see `bracketology.scoring.score_brackets`
+        """
+        if isinstance(scoring, str):
+            scoring = SCORING_SYSTEMS[scoring]
+        self.model_ids = list(models)
+        self.years = [int(year) for year in years]
+        self.seed = seed
+        self._model_index = {model_id: i for i, model_id in enumerate(self.model_ids)}
+        self._year_index = {year: i for i, year in enumerate(self.years)}
+
+        matrices = np.stack([np.stack([round_win_matrices(year, models[model_id])
+                                       for year in self.years])
+                             for model_id in self.model_ids]).astype(np.float32)
+        results = np.stack([actual_winners(year) for year in self.years])
+        points = np.stack([scoring(get_field(year), actual_winners(year))
+                           for year in self.years]).astype(np.float32)
+        draws = np.random.default_rng(seed).random((n_draws, N_GAMES), dtype=np.float32)
+
+        self._blocks = []
+        specs = {}
+        for key, array in (('matrices', matrices), ('results', results),
+                           ('points', points), ('draws', draws)):
+            block, specs[key] = _create_shared(array)
+            self._blocks.append(block)
+        self.n_draws = n_draws
+        self._pool = multiprocessing.Pool(workers, initializer=_attach_worker, initargs=(specs,))
+
+    def run(self, model_id, years=None, n_trials=10_000, task_size=1000):
+        """
+        Simulate and score a model over many years.
+
+        Parameters
+        ----------
+        model_id : str
+            Which model to run
+        years : iterable of int, optional
+            Years to run, the default is every year of the pool
+        n_trials : int, optional
+            Number of simulations per year
+        task_size : int, optional
+            Number of simulations per task
+
+        Returns
+        -------
+        results : dict
+            For each year, the same statistics as `bracketology.backtest.backtest`
+            plus ``advancement``, the fraction of trials in which each team of
+            the `Field` won each round (an array of shape (64, 6))
+        """
+        model = self._model_index[model_id]
+        years = self.years if years is None else [int(year) for year in years]
+        tasks = []
+        for year in years:
+            year_index = self._year_index[year]
+            # Tasks do not straddle the end of the shared random numbers
+            bounds = sorted(set(list(range(0, n_trials, task_size)) + [min(self.n_draws, n_trials)]))
+            bounds = [start for start in bounds if start < n_trials] + [n_trials]
+            tasks.extend((model, year_index, year, start, stop, self.seed)
+                         for start, stop in zip(bounds, bounds[1:]))
+
+        totals = {year: [0, np.zeros(8, np.int64), np.zeros(8, np.int64),
+                         np.zeros((N_TEAMS, 6), np.int64)] for year in years}
+        for year, n, sums, squares, advancement in self._pool.imap_unordered(_run_task, tasks):
+            total = totals[year]
+            total[0] += n
+            total[1] += sums
+            total[2] += squares
+            total[3] += advancement
+
+        results = {}
+        for year, (n, sums, squares, advancement) in totals.items():
+            stats = [_mean_std(n, int(s), int(sq)) for s, sq in zip(sums, squares)]
+            results[year] = {
+                'n_trials': n,
+                'total_score': stats[0],
+                'n_games_correct': stats[1],
+                'rounds': stats[2:],
+                'advancement': advancement / max(n, 1),
+            }
+        return results
+
+    def close(self):
+        """
+        Stop the workers and free the shared memory
+        """
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
@@ -0,0 +1,420 @@
+import pickle
+import random
+from collections import OrderedDict
+import numpy as np
+from bracketology.engine import (N_TEAMS, ROUND_OF_GAME, ROUND_SLICES, PARENT_GAME, as_fixed,
+                                 as_win_prob)
+from bracketology.dataset import load_brackets
+from bracketology.fields import get_field
+from bracketology.rng import as_stream
+from bracketology.scoring import ROUND_POINTS
+
+# Maximum number of (model, year) matrices kept by `ProbabilityModel.matrix`
+MATRIX_CACHE_SIZE = 256
+_matrix_cache = OrderedDict()
+
+class ProbabilityModel():
+    """
+    A model of the probability that one team beats another.
+
+    Subclasses implement `win_probability`. The model is evaluated once for
+    every pair of teams in a year and the 64x64 matrix is cached, so
+    expensive models are not re-evaluated for the same matchup. The batch
+    engine, `advancement_probabilities` and the per-game simulator returned
+    by `sim_func` all use the cached matrix.
+
+    The model should be consistent, the probability that ``team1`` beats
+    ``team2`` is taken to be one minus the probability that ``team2`` beats
+    ``team1``. Models are cached by identity, create a new model rather than
+    changing the parameters of one that has been used.
+    """
+    def win_probability(self, team1, team2):
+        """
+        Probability that `team1` beats `team2`
+
+        Parameters
+        ----------
+        team1, team2 : Team
+            The two teams, `team1` is the top team of the game
+        """
+        raise NotImplementedError
+
+    def matrix(self, year):
+        """
+        The cached 64x64 win probability matrix for a year, where
+        ``matrix[i, j]`` is the probability that team ``i`` of the `Field`
+        beats team ``j``
+        """
+        key = (self, int(year))
+        matrix = _matrix_cache.get(key)
+        if matrix is None:
+            matrix = self._build_matrix(get_field(year))
+            _matrix_cache[key] = matrix
+            if len(_matrix_cache) > MATRIX_CACHE_SIZE:
+                _matrix_cache.popitem(last=False)
+        else:
+            _matrix_cache.move_to_end(key)
+        return matrix
+
+    def _build_matrix(self, field):
+        matrix = np.full((N_TEAMS, N_TEAMS), 0.5)
+        teams = field.teams
+        for i in range(N_TEAMS):
+            for j in range(i + 1, N_TEAMS):
+                matrix[i, j] = self.win_probability(teams[i], teams[j])
+                matrix[j, i] = 1.0 - matrix[i, j]
+        matrix.setflags(write=False)
+        return matrix
+
+    def sim_func(self, year, rng=None):
+        """
+        A simulator function for `Bracket` that picks winners using the
+        cached matrix for `year`. Brackets of other years use the matrix of
+        their own year.
+
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        rng : int, numpy.random.Generator, random.Random or UniformStream, optional
+            Random number generator or seed, see `bracketology.rng.as_stream`.
+            The default is the `random` module
+        """
+        return _MatrixSimFunc(self, get_field(year), as_stream(rng))
+
+class FunctionModel(ProbabilityModel):
+    """
+    A `ProbabilityModel` from a function that takes two teams and returns
+    the probability that the first team wins
+    """
+    def __init__(self, func):
+        """
+        Parameters
+        ----------
+        func : function
+            Function of ``(team1, team2)`` returning the probability that
+            `team1` beats `team2`
+        """
+        self.func = func
+
+    def win_probability(self, team1, team2):
+        return self.func(team1, team2)
+
+def clear_matrix_cache():
+    """
+    Drop every cached `ProbabilityModel` matrix
+    """
+    _matrix_cache.clear()
+
+class _MatrixSimFunc():
+    # A picklable sim_func that looks up the top team's win probability.
+    # Teams are shared by every `Bracket` of a year (see `get_field`), so a
+    # game between teams of another year switches to that year's matrix
+    def __init__(self, model, field, rng):
+        self.model = model
+        self.rng = rng
+        self._use_field(field)
+
+    def _use_field(self, field):
+        self.year = int(field.year)
+        self.teams = field.teams
+        self.index = field.index
+        self.matrix = self.model.matrix(self.year)
+
+    def _switch_year(self, team):
+        field = _field_of(team)
+        if field is None:
+            raise ValueError(f"{team.name} is not a team of {self.year} or any other "
+                             "year, sim_func only plays teams from get_field")
+        if self.model is None:
+            raise ValueError(f"sim_func for {self.year} cannot play {field.year}, its "
+                             "model could not be pickled to this process")
+        self._use_field(field)
+
+    def rebind_rng(self, rng):
+        rebound = _MatrixSimFunc.__new__(_MatrixSimFunc)
+        rebound.__dict__.update(self.__dict__)
+        rebound.rng = as_stream(rng) if self.rng is not None else None
+        return rebound
+
+    def __getstate__(self):
+        # A process has its own Team objects, they are looked up again when
+        # unpickled. A model that cannot be pickled (e.g. a FunctionModel of
+        # a lambda) still leaves a simulator for the one year
+        state = {key: value for key, value in self.__dict__.items()
+                 if key not in ('teams', 'index')}
+        try:
+            pickle.dumps(self.model)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            state['model'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        field = get_field(self.year)
+        self.teams = field.teams
+        self.index = field.index
+
+    def __call__(self, the_game):
+        top = the_game.top_team
+        bottom = the_game.bottom_team
+        i = self.index.get(top.name)
+        if i is None or self.teams[i] is not top:
+            self._switch_year(top)
+            i = self.index[top.name]
+        p_top = self.matrix[i, self.index[bottom.name]]
+        draw = random.random() if self.rng is None else self.rng.random()
+        return top if draw < p_top else bottom
+
+def _field_of(team):
+    # The `Field` whose shared Team objects include `team`, if any
+    for year in sorted(load_brackets()):
+        field = get_field(year)
+        i = field.index.get(team.name)
+        if i is not None and field.teams[i] is team:
+            return field
+    return None
+
+def round_win_matrices(year, win_prob):
+    """
+    Win probabilities of every possible matchup in every round.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Same as for `bracketology.engine.simulate`
+
+    Returns
+    -------
+    matrices : numpy.ndarray
+        Array of shape (6, 64, 64). ``matrices[r - 1, i, j]`` is the probability
+        that team ``i`` beats team ``j`` if they meet in round ``r``. Only the
+        top team's probability (``i < j``) is taken from `win_prob`, the bottom
+        team's is one minus that, the same way the engine uses it
+    """
+    field = get_field(year)
+    win_prob = as_win_prob(year, win_prob)
+    top, bottom = np.triu_indices(N_TEAMS, k=1)
+    matrices = np.zeros((6, N_TEAMS, N_TEAMS))
+    for round_number in range(1, 7):
+        if callable(win_prob):
+            p_top = win_prob(field, top.astype(np.uint8), bottom.astype(np.uint8), round_number)
+        else:
+            p_top = np.asarray(win_prob, dtype=np.float64)[top, bottom]
+        matrices[round_number - 1, top, bottom] = p_top
+        matrices[round_number - 1, bottom, top] = 1.0 - matrices[round_number - 1, top, bottom]
+    return matrices
+
+def advancement_probabilities(year, win_prob, fixed=None):
+    """
+    Exact probability of each team winning each round, by propagating
+    each team's chance of reaching a game up the bracket.
+
+    For a game in round ``r``, a team from the top half wins with the
+    probability that it won its round ``r - 1`` game, times its chance
+    of beating each possible opponent from the bottom half weighted by the
+    chance that opponent got there. No simulation is needed.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Same as for `bracketology.engine.simulate`
+    fixed : array-like or dict, optional
+        Results that are already known, see `bracketology.engine.as_fixed`.
+        The probabilities are then conditional on those results
+
+    Returns
+    -------
+    probabilities : numpy.ndarray
+        Array of shape (64, 6). ``probabilities[i, r - 1]`` is the probability
+        that team ``i`` of the `Field` wins its round ``r`` game, so column 2
+        is making the elite 8, column 3 the final four and column 5 winning
+        the championship
+    """
+    if fixed is not None:
+        fixed = as_fixed(fixed)
+    return _advance(round_win_matrices(year, win_prob), fixed)
+
+def _advance(matrices, fixed=None):
+    probabilities = np.empty((N_TEAMS, 6))
+    reached = np.ones(N_TEAMS)
+    for round_number in range(1, 7):
+        half = 1 << (round_number - 1)
+        n_games = N_TEAMS // (2 * half)
+        blocks = reached.reshape(n_games, 2, half)
+        top, bottom = blocks[:, 0], blocks[:, 1]
+        # Matchup probabilities between the two halves of each game
+        game_teams = np.arange(N_TEAMS).reshape(n_games, 2, half)
+        m = matrices[round_number - 1][game_teams[:, 0, :, None], game_teams[:, 1, None, :]]
+        top_wins = top * np.einsum('gij,gj->gi', m, bottom)
+        bottom_wins = bottom * np.einsum('gij,gi->gj', 1.0 - m, top)
+        reached = np.stack([top_wins, bottom_wins], axis=1).reshape(N_TEAMS)
+        if fixed is not None:
+            # A known result puts all of the game's probability on its winner
+            known = fixed[ROUND_SLICES[round_number - 1]]
+            for game in np.flatnonzero(known >= 0):
+                reached[game * 2 * half:(game + 1) * 2 * half] = 0.0
+                reached[known[game]] = 1.0
+        probabilities[:, round_number - 1] = reached
+    return probabilities
+
+def _ancestor_pairs():
+    # Every pair of games (g, h) where the winner of h plays in g
+    later, earlier = [], []
+    for game in range(len(PARENT_GAME)):
+        parent = PARENT_GAME[game]
+        while parent >= 0:
+            later.append(parent)
+            earlier.append(game)
+            parent = PARENT_GAME[parent]
+    return np.array(later), np.array(earlier)
+
+_LATER_GAME, _EARLIER_GAME = _ancestor_pairs()
+
+class ScoreDistribution():
+    """
+    Exact mean and variance of the score of a bracket under a model,
+    without simulating.
+
+    The score is a sum over the games of the points for the round times
+    whether the picked team wins that game. The mean only needs each
+    team's chance of winning each round (`advancement_probabilities`).
+    Picks in separate parts of the bracket are independent, so the
+    variance only needs the covariance of a game with the later games its
+    winner plays in. Those come from the chance of a team winning a later
+    game given that a team won an earlier one, worked out once for every
+    team and pair of rounds by following the team's path up the bracket.
+    After that, scoring a bracket is a handful of array lookups.
+    """
+    def __init__(self, year, win_prob, points=ROUND_POINTS):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        win_prob : numpy.ndarray, function or ProbabilityModel
+            Same as for `bracketology.engine.simulate`
+        points : array-like, optional
+            Points for a correct pick in each round, indexed by round number
+            (index 0 is unused). The default is 1, 2, 4, 8, 16, 32
+        """
+        self.year = year
+        self.game_points = np.asarray(points, dtype=np.float64)[ROUND_OF_GAME]
+        matrices = round_win_matrices(year, win_prob)
+        self.advance = _advance(matrices)
+        self._conditional = _conditional_advance(matrices, self.advance)
+
+    def _winners(self, bracket):
+        if hasattr(bracket, 'winners'):
+            return np.asarray(bracket.winners)
+        if hasattr(bracket, 'Finals'):
+            from bracketology.compact import CompactBracket
+            return CompactBracket.from_bracket(bracket).winners
+        return np.asarray(bracket)
+
+    def game_probabilities(self, bracket):
+        """
+        Probability that each pick of a bracket is correct
+
+        Parameters
+        ----------
+        bracket : Bracket, CompactBracket or numpy.ndarray
+            The picks, a winner array may have shape (63,) or (n, 63)
+
+        Returns
+        -------
+        probabilities : numpy.ndarray
+            Array of shape (63,) or (n, 63)
+        """
+        winners = self._winners(bracket)
+        return self.advance[winners, ROUND_OF_GAME - 1]
+
+    def expected_score(self, bracket):
+        """
+        Expected score of a bracket, or of each of many brackets
+        """
+        return self.game_probabilities(bracket) @ self.game_points
+
+    def variance(self, bracket):
+        """
+        Variance of the score of a bracket, or of each of many brackets
+        """
+        winners = self._winners(bracket)
+        p = self.advance[winners, ROUND_OF_GAME - 1]
+        points = self.game_points
+        variance = (points ** 2 * p * (1.0 - p)).sum(axis=-1)
+
+        later, earlier = _LATER_GAME, _EARLIER_GAME
+        a, b = winners[..., later], winners[..., earlier]
+        both = p[..., earlier] * self._conditional[b, ROUND_OF_GAME[earlier] - 1,
+                                                   ROUND_OF_GAME[later] - 1, a]
+        covariance = both - p[..., later] * p[..., earlier]
+        return variance + 2.0 * (covariance * points[later] * points[earlier]).sum(axis=-1)
+
+    def std(self, bracket):
+        """
+        Standard deviation of the score of a bracket, or of each of many brackets
+        """
+        return np.sqrt(self.variance(bracket))
+
+def _conditional_advance(matrices, advance):
+    # conditional[b, s - 1, r - 1, a] is the probability that team a wins
+    # its round r game given that team b won its round s game, for r > s
+    conditional = np.zeros((N_TEAMS, 6, 6, N_TEAMS))
+    for b in range(N_TEAMS):
+        for start_round in range(1, 6):
+            size = 1 << start_round
+            first = (b >> start_round) << start_round
+            reached = np.zeros(size)
+            reached[b - first] = 1.0
+            for round_number in range(start_round + 1, 7):
+                # The other half of the game is independent of b's results
+                half = size
+                size *= 2
+                block = (b >> round_number) << round_number
+                ours = np.arange(first, first + half)
+                other_first = block + half if first == block else block
+                others = np.arange(other_first, other_first + half)
+                other_reached = advance[others, round_number - 2]
+                m = matrices[round_number - 1]
+                ours_win = reached * (m[ours[:, None], others[None, :]] @ other_reached)
+                others_win = other_reached * (m[others[:, None], ours[None, :]] @ reached)
+                if first == block:
+                    reached = np.concatenate([ours_win, others_win])
+                else:
+                    reached = np.concatenate([others_win, ours_win])
+                first = block
+                conditional[b, start_round - 1, round_number - 1, block:block + size] = reached
+    return conditional
+
+def expected_score(bracket, win_prob, points=ROUND_POINTS):
+    """
+    Exact expected score of a bracket under a model, see `ScoreDistribution`.
+    To evaluate many brackets with the same model, create a
+    `ScoreDistribution` once and use its methods instead.
+
+    Parameters
+    ----------
+    bracket : Bracket or CompactBracket
+        The picks
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Same as for `bracketology.engine.simulate`
+    points : array-like, optional
+        Points for a correct pick in each round, indexed by round number
+
+    Returns
+    -------
+    expected_score : float
+    """
+    return float(ScoreDistribution(bracket.year, win_prob, points).expected_score(bracket))
+
+def score_variance(bracket, win_prob, points=ROUND_POINTS):
+    """
+    Exact variance of the score of a bracket under a model, see
+    `ScoreDistribution`. Arguments are the same as for `expected_score`
+    """
+    return float(ScoreDistribution(bracket.year, win_prob, points).variance(bracket))
@@ -0,0 +1,164 @@
+import functools
+import tracemalloc
+from collections import defaultdict
+from time import perf_counter
+from bracketology.brackets import Bracket
+
+# The Bracket methods that run a round, in order
+ROUND_METHODS = ('run_first_round', 'run_second_round', 'run_sweet_sixteen',
+                 'run_elite_eight', 'run_final_four', 'run_championship')
+
+class ProfileStats():
+    """
+    Statistics collected by `profile`.
+
+    Attributes
+    ----------
+    sim_calls : dict
+        Number of `sim_func` calls in each round, keyed by round number
+    sim_time : dict
+        Seconds spent inside `sim_func` in each round, keyed by round number
+    round_calls : dict
+        Number of times each `Bracket` round method ran, keyed by method name
+    round_time : dict
+        Seconds spent in each `Bracket` round method, keyed by method name
+    round_memory : dict
+        Net bytes allocated by each round method, only when allocations are traced
+    peak_memory : int
+        Peak traced memory in bytes, only when allocations are traced
+    """
+    def __init__(self):
+        self.sim_calls = defaultdict(int)
+        self.sim_time = defaultdict(float)
+        self.round_calls = defaultdict(int)
+        self.round_time = defaultdict(float)
+        self.round_memory = defaultdict(int)
+        self.peak_memory = None
+
+    @property
+    def total_sim_calls(self):
+        return sum(self.sim_calls.values())
+
+    @property
+    def total_sim_time(self):
+        """Seconds spent inside `sim_func`"""
+        return sum(self.sim_time.values())
+
+    @property
+    def total_time(self):
+        """Seconds spent in the `Bracket` round methods, including `sim_func`"""
+        return sum(self.round_time.values())
+
+    @property
+    def overhead_time(self):
+        """
+        Seconds spent in the round methods outside of `sim_func`. This
+        includes the cost of timing each call
+        """
+        return self.total_time - self.total_sim_time
+
+    def report(self):
+        """
+        A table of the statistics as a string
+        """
+        lines = [f"{'round':<20}{'calls':>8}{'total ms':>12}{'sim_func calls':>16}{'sim_func ms':>14}"]
+        for round_number, method in enumerate(ROUND_METHODS, start=1):
+            lines.append(f"{method:<20}{self.round_calls[method]:>8}"
+                         f"{self.round_time[method] * 1e3:>12.2f}"
+                         f"{self.sim_calls[round_number]:>16}"
+                         f"{self.sim_time[round_number] * 1e3:>14.2f}")
+        lines.append(f"sim_func time: {self.total_sim_time * 1e3:.2f} ms, "
+                     f"framework overhead: {self.overhead_time * 1e3:.2f} ms")
+        if self.peak_memory is not None:
+            lines.append(f"peak traced memory: {self.peak_memory / 1024:.1f} KiB")
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return (f"<ProfileStats sim_func calls={self.total_sim_calls} "
+                f"sim_func={self.total_sim_time:.4f}s overhead={self.overhead_time:.4f}s>")
+
+class _TimedSimFunc():
+    # Wraps a sim_func to count and time its calls by round
+    def __init__(self, sim_func, stats):
+        self.sim_func = sim_func
+        self.stats = stats
+
+    def __call__(self, the_game):
+        start = perf_counter()
+        winner = self.sim_func(the_game)
+        elapsed = perf_counter() - start
+        self.stats.sim_calls[the_game.round_number] += 1
+        self.stats.sim_time[the_game.round_number] += elapsed
+        return winner
+
+def _instrument(method, name, stats, trace_allocations):
+    @functools.wraps(method)
+    def run_round(self, sim_func):
+        if trace_allocations:
+            memory_before = tracemalloc.get_traced_memory()[0]
+        start = perf_counter()
+        result = method(self, _TimedSimFunc(sim_func, stats))
+        stats.round_time[name] += perf_counter() - start
+        stats.round_calls[name] += 1
+        if trace_allocations:
+            stats.round_memory[name] += tracemalloc.get_traced_memory()[0] - memory_before
+        return result
+    return run_round
+
+class profile():
+    """
+    Context manager that instruments `Bracket` simulations.
+
+    While it is active the `Bracket` round methods are replaced with
+    versions that count and time every `sim_func` call and every round.
+    The originals are put back on exit, so there is no cost at all when
+    profiling is off. Only one profile can be active at a time, and it
+    applies to every thread.
+
+    Examples
+    --------
+    >>> with bracketology.profile() as stats:
+    ...     Bracket(2019).sim(sim_func)
+    >>> print(stats.report())
+    """
+    _active = None
+
+    def __init__(self, trace_allocations=False):
+        """
+        Parameters
+        ----------
+        trace_allocations : bool, optional
+            Also record memory allocated in each round with `tracemalloc`.
+            This slows the simulation down a lot. The default is False
+        """
+        self.trace_allocations = trace_allocations
+        self.stats = ProfileStats()
+        self._originals = {}
+        self._started_tracing = False
+
+    def __enter__(self):
+        if profile._active is not None:
+            raise RuntimeError("A bracketology profile is already active")
+        profile._active = self
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.trace_allocations:
+            tracemalloc.reset_peak()
+        for name in ROUND_METHODS:
+            method = getattr(Bracket, name)
+            self._originals[name] = method
+            setattr(Bracket, name, _instrument(method, name, self.stats, self.trace_allocations))
+        return self.stats
+
+    def __exit__(self, *exc_info):
+        for name, method in self._originals.items():
+            setattr(Bracket, name, method)
+        self._originals = {}
+        if self.trace_allocations:
+            self.stats.peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+        profile._active = None
+        return False
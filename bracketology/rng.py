@@ -0,0 +1,88 @@
+import numpy as np
+
+class UniformStream():
+    """
+    A stream of uniform random numbers in [0, 1) drawn from a NumPy
+    `Generator` in blocks.
+
+    Has the same ``random()`` method as `random.Random`, so it can be passed
+    as the `rng` of the simulators, but numbers are generated a block at a
+    time instead of one call per game. Streams created from the same seed
+    produce the same numbers, which lets strategies be compared with common
+    random numbers.
+    """
+    def __init__(self, seed=None, block_size=4096):
+        """
+        Parameters
+        ----------
+        seed : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+            Seed for the stream, or the generator to draw from
+        block_size : int, optional
+            How many numbers to generate at a time
+        """
+        if isinstance(seed, np.random.Generator):
+            self.generator = seed
+        else:
+            self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._values = iter(())
+
+    def random(self):
+        """
+        The next uniform random number
+        """
+        try:
+            return next(self._values)
+        except StopIteration:
+            self._values = iter(self.generator.random(self.block_size).tolist())
+            return next(self._values)
+
+    def spawn(self, n):
+        """
+        Create `n` child streams that are independent of this one and of
+        each other
+        """
+        return [UniformStream(generator, self.block_size)
+                for generator in self.generator.spawn(n)]
+
+def spawn_streams(seed, n, block_size=4096):
+    """
+    Create `n` independent streams from one seed, e.g. one per worker process.
+    The same seed always gives the same streams.
+
+    Parameters
+    ----------
+    seed : int or numpy.random.SeedSequence
+        Seed for the streams
+    n : int
+        Number of streams
+    block_size : int, optional
+        How many numbers each stream generates at a time
+
+    Returns
+    -------
+    streams : list of UniformStream
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [UniformStream(child, block_size) for child in seed.spawn(n)]
+
+def as_stream(rng):
+    """
+    Turn the `rng` argument of a simulator into an object with a
+    ``random()`` method.
+
+    Parameters
+    ----------
+    rng : None, int, numpy.random.SeedSequence, numpy.random.Generator, random.Random or UniformStream
+        None is returned as is, meaning use the `random` module. Seeds and
+        NumPy generators become a `UniformStream`, and anything else with
+        a ``random()`` method is used directly
+    """
+    if rng is None:
+        return None
+    if isinstance(rng, (int, np.integer, np.random.SeedSequence, np.random.Generator)):
+        return UniformStream(rng)
+    if not hasattr(rng, 'random'):
+        raise TypeError("rng must be a seed, a numpy Generator or have a random() method")
+    return rng
@@ -0,0 +1,144 @@
+from functools import lru_cache
+import numpy as np
+from bracketology.engine import N_GAMES, ROUND_SLICES, ROUND_OF_GAME
+from bracketology.fields import RESULT_ROUNDS, get_field
+
+# Points for a correct pick in each round (index 0 is unused)
+ROUND_POINTS = np.array([0, 1, 2, 4, 8, 16, 32], dtype=np.int64)
+
+# Indicator of the round of each game. Counting correct picks per round
+# as a matrix product is much faster than summing each round's columns
+_ROUND_INDICATOR = (ROUND_OF_GAME[:, None] == np.arange(1, 7)).astype(np.float32)
+
+@lru_cache(maxsize=None)
+def _actual_winners(year):
+    field = get_field(year)
+    round_sets = [field.result_sets[key] for key in RESULT_ROUNDS] + [{field.result_winner}]
+    winners = np.empty(N_GAMES, dtype=np.uint8)
+    alive = list(range(len(field)))
+    for games, advanced in zip(ROUND_SLICES, round_sets):
+        alive = [top if field.names[top] in advanced else bottom
+                 for top, bottom in zip(alive[0::2], alive[1::2])]
+        winners[games] = alive
+    winners.setflags(write=False)
+    return winners
+
+def actual_winners(year):
+    """
+    The actual results of a tournament in the same layout as a row of
+    `bracketology.engine.simulate`.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        Read-only array with the index of the team that won each of the 63 games
+    """
+    return _actual_winners(int(year))
+
+def game_teams(winners):
+    """
+    The two teams that played each game of each bracket.
+
+    Parameters
+    ----------
+    winners : numpy.ndarray
+        Array of shape (n, 63) of winning team indices
+
+    Returns
+    -------
+    top, bottom : numpy.ndarray
+        Arrays of shape (n, 63) with the top and bottom team of each game
+    """
+    winners = np.atleast_2d(winners)
+    top = np.empty_like(winners)
+    bottom = np.empty_like(winners)
+    first = ROUND_SLICES[0]
+    top[:, first] = np.arange(0, 64, 2, dtype=winners.dtype)
+    bottom[:, first] = np.arange(1, 64, 2, dtype=winners.dtype)
+    for prev, games in zip(ROUND_SLICES, ROUND_SLICES[1:]):
+        top[:, games] = winners[:, prev][:, 0::2]
+        bottom[:, games] = winners[:, prev][:, 1::2]
+    return top, bottom
+
+def standard_points(field, results):
+    """
+    Standard scoring, correct picks are worth 1, 2, 4, 8, 16 and 32 points
+    from the first round to the championship. This is how `Bracket.score` scores.
+
+    A scoring system only depends on the actual results, so the points of
+    each game are computed once per year instead of once per bracket.
+
+    Parameters
+    ----------
+    field : Field
+        The teams in the tournament
+    results : numpy.ndarray
+        The actual winner of each of the 63 games, see `actual_winners`
+
+    Returns
+    -------
+    points : numpy.ndarray
+        Points each of the 63 games is worth when it is picked correctly
+    """
+    return ROUND_POINTS[ROUND_OF_GAME]
+
+def seed_bonus_points(field, results):
+    """
+    Standard scoring plus the seed of the winning team for each correct pick.
+    Arguments and return value are the same as `standard_points`.
+    """
+    return standard_points(field, results) + field.seeds[results]
+
+def upset_bonus_points(field, results):
+    """
+    Standard scoring plus the seed difference for each correctly picked upset.
+    Arguments and return value are the same as `standard_points`.
+    """
+    top, bottom = game_teams(results)
+    loser = np.where(results == top[0], bottom[0], top[0])
+    seed_gap = field.seeds[results].astype(np.int64) - field.seeds[loser]
+    return standard_points(field, results) + np.maximum(seed_gap, 0)
+
+SCORING_SYSTEMS = {
+    'standard': standard_points,
+    'seed_bonus': seed_bonus_points,
+    'upset_bonus': upset_bonus_points,
+}
+
+def score_brackets(year, winners, scoring=standard_points):
+    """
+    Score many brackets against the actual results at once.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    winners : numpy.ndarray
+        Array of shape (n, 63) of picked winners, as returned by
+        `bracketology.engine.simulate`
+    scoring : function or str, optional
+        Scoring system, one of the functions in `SCORING_SYSTEMS` or its name.
+        The default is `standard_points`
+
+    Returns
+    -------
+    n_correct_by_round : numpy.ndarray
+        Array of shape (n, 6), number of games correct in each round
+    total_score : numpy.ndarray
+        Array of shape (n,), total points of each bracket
+    """
+    if isinstance(scoring, str):
+        scoring = SCORING_SYSTEMS[scoring]
+    field = get_field(year)
+    winners = np.atleast_2d(winners)
+    results = actual_winners(year)
+    correct = (winners == results).astype(np.float32)
+    n_correct_by_round = (correct @ _ROUND_INDICATOR).astype(np.int64)
+    points = scoring(field, results).astype(np.float32)
+    total_score = (correct @ points).astype(np.int64)
+    return n_correct_by_round, total_score
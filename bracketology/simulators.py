@@ -1,5 +1,9 @@
 import random
-def upset_prob(p):
+from functools import lru_cache, partial
+import numpy as np
+from bracketology.rng import as_stream
+
+def upset_prob(p, rng=None):
     """
     Given a probability between 0-1 will return a function that can
     be as an algorithm to fill out an NCAA bracket with `p` as 
@@ -9,6 +13,9 @@ def upset_prob(p):
     ----------
     p  :  float
         The probability of an upset
+    rng  :  int, numpy.random.Generator, random.Random or UniformStream, optional
+        Random number generator or seed, see `bracketology.rng.as_stream`.
+        The default is the `random` module
     
     Returns
     -------
@@ -19,30 +26,201 @@ def upset_prob(p):
     assert p <= 1.0, "p must be <= 1.0"
     assert p >= 0.0, "p must be >= 0.0"
     
-    def sim_func(the_game):
-        team1 = the_game.top_team
-        team2 = the_game.bottom_team
-
-        team1_seed = team1.seed
-        team2_seed = team2.seed
-        
-        team1_is_higher_seed = (team1_seed <= team2_seed)
-        is_upset = (random.random() < p)
-        
-        if team1_is_higher_seed:
-            if is_upset:
-                winner = team2
-            else:
-                winner = team1
+    # A partial of a module level function (unlike a closure) can be
+    # pickled and sent to worker processes
+    return partial(_pick_upset, p, as_stream(rng))
+
+def rebind_rng(sim_func, rng):
+    """
+    A copy of a simulator that draws from `rng` instead of the generator
+    it was created with. `bracketology.backtest.backtest` uses this to give
+    each chunk of trials its own stream.
+
+    Simulators from this module with a bound `rng` are rebound, as is
+    anything with a ``rebind_rng(rng)`` method. Simulators without their
+    own generator use the `random` module and are returned as is.
+
+    Parameters
+    ----------
+    sim_func : function
+        A function that take in `Game` and returns a `Team` of that Game
+    rng : int, numpy.random.SeedSequence, numpy.random.Generator, random.Random or UniformStream
+        The new generator, see `bracketology.rng.as_stream`
+    """
+    if isinstance(sim_func, partial) and sim_func.func in _SEEDED_PICKS:
+        if sim_func.args[-1] is None:
+            return sim_func
+        return partial(sim_func.func, *sim_func.args[:-1], as_stream(rng))
+    rebind = getattr(sim_func, 'rebind_rng', None)
+    return sim_func if rebind is None else rebind(rng)
+
+def _pick_upset(p, rng, the_game):
+    team1 = the_game.top_team
+    team2 = the_game.bottom_team
+
+    team1_seed = team1.seed
+    team2_seed = team2.seed
+    
+    team1_is_higher_seed = (team1_seed <= team2_seed)
+    is_upset = ((random.random() if rng is None else rng.random()) < p)
+    
+    if team1_is_higher_seed:
+        if is_upset:
+            winner = team2
         else:
-            if is_upset:
-                winner = team1
-            else:
-                winner = team2
-        return winner
+            winner = team1
+    else:
+        if is_upset:
+            winner = team1
+        else:
+            winner = team2
+    return winner
+
+def upset_prob_batch(p):
+    """
+    Batch version of `upset_prob` for `bracketology.engine.simulate`.
+    Picks an upset with probability `p` for every game at once.
+    
+    Parameters
+    ----------
+    p  :  float
+        The probability of an upset, anything `float` accepts
+    
+    Returns
+    -------
+    batch_func  :  function
+        function that takes ``(field, top, bottom, round_number)`` and
+        returns the probability that each top team wins
+    """
+    p = float(p)
+    assert p <= 1.0, "p must be <= 1.0"
+    assert p >= 0.0, "p must be >= 0.0"
+    
+    return partial(_upset_top_win_prob, p)
+
+def _upset_top_win_prob(p, field, top, bottom, round_number):
+    top_is_higher_seed = (field.seeds[top] <= field.seeds[bottom])
+    return np.where(top_is_higher_seed, np.float32(1.0 - p), np.float32(p))
+
+def seed_win_table(strength=10.0, years=None):
+    """
+    Smoothed historical probability that one seed beats another in each round.
 
-    return sim_func
+    The rate of each (seed, seed, round) matchup is shrunk towards the rate
+    of the same two seeds over all rounds, which is in turn shrunk towards
+    the rate of every game with the same seed difference. Matchups that
+    were played many times keep their own rate, and rare ones borrow from
+    the broader rates.
+
+    Parameters
+    ----------
+    strength : float, optional
+        How many games' worth of weight the broader rate gets at each level.
+        With 0 the raw rates are used, and only matchups that were never
+        played fall back to the broader rate
+    years : iterable of int, optional
+        Years to take the games from, the default is every year. Leave out
+        the year being simulated to avoid using its results
+
+    Returns
+    -------
+    table : numpy.ndarray
+        Read-only array of shape (7, 17, 17), ``table[r, a, b]`` is the
+        probability that seed ``a`` beats seed ``b`` in round ``r``
+        (index 0 is unused)
+    """
+    if strength < 0:
+        raise ValueError("strength must be >= 0")
+    years = None if years is None else tuple(sorted(int(year) for year in years))
+    return _seed_win_table(float(strength), years)
+
+@lru_cache(maxsize=32)
+def _seed_win_table(strength, years):
+    from bracketology.history import GameTable, game_table
+    games = game_table() if years is None else GameTable(years)
+    wins = np.stack([games.seed_win_rates(round_number)[0] for round_number in range(1, 7)])
+    wins = np.concatenate([np.zeros((1, 17, 17), dtype=wins.dtype), wins]).astype(np.float64)
+    n_games = wins + wins.transpose(0, 2, 1)
+
+    # Rate of the better seed by seed difference, over every round
+    seeds = np.arange(17)
+    difference = seeds[None, :] - seeds[:, None]
+    pair_wins, pair_games = wins.sum(axis=0), n_games.sum(axis=0)
+    difference_wins = np.bincount(difference[difference > 0], weights=pair_wins[difference > 0], minlength=17)
+    difference_games = np.bincount(difference[difference > 0], weights=pair_games[difference > 0], minlength=17)
+    difference_rate = _shrink(difference_wins, difference_games, strength, 0.5)
+    prior = np.where(difference > 0, difference_rate[np.abs(difference)],
+                     1.0 - difference_rate[np.abs(difference)])
+
+    pair_rate = _shrink(pair_wins, pair_games, strength, prior)
+    table = _shrink(wins, n_games, strength, pair_rate)
+    table[:, seeds, seeds] = 0.5
+    table[0] = 0.5
+    table = table.astype(np.float32)
+    table.setflags(write=False)
+    return table
+
+def _shrink(wins, n_games, strength, prior):
+    # Win rate shrunk towards `prior`, which is used as is where there are
+    # no games and no smoothing (strength 0) to avoid 0/0
+    total = n_games + strength
+    rate = (wins + strength * prior) / np.where(total > 0, total, 1.0)
+    return np.where(total > 0, rate, prior)
+
+def seed_matchup_prob(strength=10.0, years=None, rng=None):
+    """
+    Returns a function to fill out an NCAA bracket by picking each game
+    with the historical win rate of the two seeds in that round, see
+    `seed_win_table`
     
+    Parameters
+    ----------
+    strength  :  float, optional
+        Smoothing of rare matchups, see `seed_win_table`
+    years  :  iterable of int, optional
+        Years to take the win rates from, the default is every year
+    rng  :  int, numpy.random.Generator, random.Random or UniformStream, optional
+        Random number generator or seed, see `bracketology.rng.as_stream`.
+        The default is the `random` module
+    
+    Returns
+    -------
+    scoring_func  :  function
+        function to pick the winner of a Game
+    """
+    # Nested lists make the per game lookup cheaper than indexing an array
+    table = seed_win_table(strength, years).tolist()
+    return partial(_pick_seed_matchup, table, as_stream(rng))
+
+def _pick_seed_matchup(table, rng, the_game):
+    team1 = the_game.top_team
+    team2 = the_game.bottom_team
+    p_team1 = table[the_game.round_number][team1.seed][team2.seed]
+    if (random.random() if rng is None else rng.random()) < p_team1:
+        return team1
+    return team2
 
+def seed_matchup_prob_batch(strength=10.0, years=None):
+    """
+    Batch version of `seed_matchup_prob` for `bracketology.engine.simulate`.
+    
+    Parameters
+    ----------
+    strength  :  float, optional
+        Smoothing of rare matchups, see `seed_win_table`
+    years  :  iterable of int, optional
+        Years to take the win rates from, the default is every year
+    
+    Returns
+    -------
+    batch_func  :  function
+        function that takes ``(field, top, bottom, round_number)`` and
+        returns the probability that each top team wins
+    """
+    return partial(_seed_matchup_top_win_prob, seed_win_table(strength, years))
 
+def _seed_matchup_top_win_prob(table, field, top, bottom, round_number):
+    return table[round_number][field.seeds[top], field.seeds[bottom]]
 
+# Per-game picks whose last bound argument is the rng, see `rebind_rng`
+_SEEDED_PICKS = (_pick_upset, _pick_seed_matchup)
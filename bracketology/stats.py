@@ -0,0 +1,188 @@
+import os
+from collections.abc import Mapping
+import numpy as np
+from bracketology.engine import N_TEAMS
+from bracketology.fields import get_field
+
+VALUES_FILE = 'values.npy'
+INDEX_FILE = 'index.json'
+
+class StatsStore():
+    """
+    Team season statistics for many years in one memory-mapped array.
+
+    The values are stored by column, as an array of shape
+    (n_features, n_years * 64). Each year takes 64 consecutive columns
+    with its teams in `Field` order, so one feature of one year, or every
+    feature of one year, is a slice of the file that is never copied.
+    Worker processes that open the same store share its pages, and a
+    store sent to another process is reopened there instead of copied.
+
+    Attributes
+    ----------
+    path : str
+        Directory the store was opened from
+    features : tuple of str
+        Names of the features
+    years : tuple of int
+        Years in the store
+    values : numpy.memmap
+        The read-only values, NaN where a team has no value
+    """
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            Directory written by `write_stats`
+        """
+        import json
+        with open(os.path.join(path, INDEX_FILE)) as f:
+            index = json.load(f)
+        self.path = path
+        self.features = tuple(index['features'])
+        self.feature_index = {feature: i for i, feature in enumerate(self.features)}
+        self._starts = {int(year): start for year, start in index['years'].items()}
+        self.years = tuple(sorted(self._starts))
+        self.values = np.load(os.path.join(path, VALUES_FILE), mmap_mode='r')
+
+    def __reduce__(self):
+        return (StatsStore, (self.path,))
+
+    def __repr__(self):
+        return f"<StatsStore {len(self.features)} features, {len(self.years)} years>"
+
+    def _columns(self, year):
+        start = self._starts.get(int(year))
+        if start is None:
+            raise ValueError(f"No stats for {year}")
+        return slice(start, start + N_TEAMS)
+
+    def feature_matrix(self, year, features=None):
+        """
+        The stats of every team of a year as a matrix, for models that
+        work on the whole field at once.
+
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        features : list of str, optional
+            Features to include, the default is all of them. Without it the
+            matrix is a view of the file, with it the columns are copied
+
+        Returns
+        -------
+        matrix : numpy.ndarray
+            Array of shape (64, n_features), row ``i`` is team ``i`` of the `Field`
+        """
+        columns = self._columns(year)
+        if features is None:
+            return self.values[:, columns].T
+        rows = [self.feature_index[feature] for feature in features]
+        return self.values[rows, columns].T
+
+    def column(self, year, feature):
+        """
+        One feature of every team of a year, a view of the file of shape (64,)
+        """
+        return self.values[self.feature_index[feature], self._columns(year)]
+
+    def team_stats(self, year, i):
+        """
+        The `TeamStats` view of team ``i`` of the `Field` of a year
+        """
+        return TeamStats(self, self._columns(year).start + i)
+
+    def attach(self, years=None):
+        """
+        Set ``Team.stats`` of the teams of each year to their `TeamStats`.
+
+        The `Team` objects are shared by every `Bracket` of a year, so this
+        only has to be done once and costs nothing per bracket.
+
+        Parameters
+        ----------
+        years : iterable of int, optional
+            Years to attach, the default is every year in the store
+        """
+        for year in self.years if years is None else years:
+            start = self._columns(year).start
+            for i, team in enumerate(get_field(year).teams):
+                team.stats = TeamStats(self, start + i)
+        return self
+
+class TeamStats(Mapping):
+    """
+    Read-only mapping of feature name to value for one team, reading from
+    a `StatsStore` without copying anything.
+    """
+    __slots__ = ('store', 'column')
+
+    def __init__(self, store, column):
+        self.store = store
+        self.column = column
+
+    def __getitem__(self, feature):
+        return float(self.store.values[self.store.feature_index[feature], self.column])
+
+    def __iter__(self):
+        return iter(self.store.features)
+
+    def __len__(self):
+        return len(self.store.features)
+
+    @property
+    def array(self):
+        """
+        All of the team's values, a view of the file
+        """
+        return self.store.values[:, self.column]
+
+    def __repr__(self):
+        return f"<TeamStats {dict(self)}>"
+
+def write_stats(path, stats, features=None):
+    """
+    Write team stats to a directory that `StatsStore` can open.
+
+    Parameters
+    ----------
+    path : str
+        Directory to write to, created if needed
+    stats : dict
+        ``{year: {team name: {feature: value}}}``. Every team must be in
+        that year's tournament, and teams or values that are missing are
+        stored as NaN
+    features : list of str, optional
+        Order of the features, the default is the order they first appear
+
+    Returns
+    -------
+    store : StatsStore
+        The new store
+    """
+    import json
+    if features is None:
+        features = list(dict.fromkeys(feature for teams in stats.values()
+                                      for values in teams.values() for feature in values))
+    feature_index = {feature: i for i, feature in enumerate(features)}
+    years = sorted(int(year) for year in stats)
+    values = np.full((len(features), len(years) * N_TEAMS), np.nan, dtype=np.float32)
+    starts = {}
+    for k, year in enumerate(years):
+        start = k * N_TEAMS
+        starts[str(year)] = start
+        index = get_field(year).index
+        teams = stats[year] if year in stats else stats[str(year)]
+        for name, team_values in teams.items():
+            if name not in index:
+                raise ValueError(f"{name} is not in the {year} tournament")
+            for feature, value in team_values.items():
+                values[feature_index[feature], start + index[name]] = value
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, VALUES_FILE), values)
+    with open(os.path.join(path, INDEX_FILE), 'w') as f:
+        json.dump({'features': list(features), 'years': starts}, f)
+    return StatsStore(path)
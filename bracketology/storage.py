@@ -0,0 +1,213 @@
+import numpy as np
+from bracketology.compact import CompactBracket, pack_outcomes, unpack_outcomes
+from bracketology.engine import N_GAMES
+
+MAGIC = b'BRKT'
+VERSION = 1
+
+# How each bracket is stored, one uint64 outcome code (see
+# `bracketology.compact.pack_outcomes`) or 63 uint8 winner indices
+FORMATS = ('codes', 'winners')
+
+# Fixed size header at the start of every file, followed by the brackets
+_HEADER = np.dtype([('magic', 'S4'), ('version', '<u2'), ('format', 'u1'), ('has_seed', 'u1'),
+                    ('year', '<u2'), ('reserved', '<u2', (3,)), ('n', '<u8'), ('seed', '<i8'),
+                    ('model_id', 'S32')])
+HEADER_SIZE = _HEADER.itemsize
+
+def _payload_dtype(format):
+    return np.dtype('<u8') if format == 'codes' else np.dtype('u1')
+
+class SimulationWriter():
+    """
+    Write simulated brackets to a file a batch at a time, so the brackets
+    never all have to be in memory. The number of brackets in the header
+    is filled in when the writer is closed.
+
+    Examples
+    --------
+    >>> with SimulationWriter('sims.brkt', 2019, model_id='seeds', seed=0) as writer:
+    ...     for winners in iter_simulations(2019, model, n=10**8, rng=0):
+    ...         writer.write(winners)
+    """
+    def __init__(self, path, year, model_id='', seed=None, format='codes'):
+        """
+        Parameters
+        ----------
+        path : str
+            File to write, replaced if it exists
+        year : int
+            Year of the NCAA tournament
+        model_id : str, optional
+            Name of the model that made the brackets, at most 32 bytes
+        seed : int, optional
+            Seed the brackets were simulated with
+        format : {'codes', 'winners'}, optional
+            Store each bracket as an 8 byte outcome code (the default), or
+            as its 63 winner indices
+        """
+        if format not in FORMATS:
+            raise ValueError(f"format must be one of {FORMATS}")
+        model_id = model_id.encode('utf-8')
+        if len(model_id) > 32:
+            raise ValueError("model_id must be at most 32 bytes")
+        self.header = np.zeros((), dtype=_HEADER)
+        self.header['magic'] = MAGIC
+        self.header['version'] = VERSION
+        self.header['format'] = FORMATS.index(format)
+        self.header['year'] = int(year)
+        self.header['model_id'] = model_id
+        if seed is not None:
+            self.header['has_seed'] = 1
+            self.header['seed'] = seed
+        self.format = format
+        self.n = 0
+        self._file = open(path, 'wb')
+        self._file.write(self.header.tobytes())
+
+    def write(self, winners):
+        """
+        Append brackets, an array of shape (n, 63) of winners
+        """
+        winners = np.asarray(winners, dtype=np.uint8).reshape(-1, N_GAMES)
+        if self.format == 'codes':
+            self._file.write(pack_outcomes(winners).astype('<u8', copy=False).tobytes())
+        else:
+            self._file.write(np.ascontiguousarray(winners).tobytes())
+        self.n += len(winners)
+
+    def write_codes(self, codes):
+        """
+        Append brackets given as outcome codes (see `pack_outcomes`)
+        """
+        codes = np.asarray(codes, dtype=np.uint64).reshape(-1)
+        if self.format == 'codes':
+            self._file.write(codes.astype('<u8', copy=False).tobytes())
+        else:
+            self._file.write(unpack_outcomes(codes).tobytes())
+        self.n += len(codes)
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.header['n'] = self.n
+        self._file.seek(0)
+        self._file.write(self.header.tobytes())
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+def save_simulations(path, year, winners, model_id='', seed=None, format='codes'):
+    """
+    Write simulated brackets to a file in one go.
+
+    Parameters
+    ----------
+    path : str
+        File to write, replaced if it exists
+    year : int
+        Year of the NCAA tournament
+    winners : numpy.ndarray
+        Array of shape (n, 63) of winners, as returned by
+        `bracketology.engine.simulate`
+    model_id, seed, format
+        See `SimulationWriter`
+    """
+    with SimulationWriter(path, year, model_id, seed, format) as writer:
+        writer.write(winners)
+
+class SimulationFile():
+    """
+    Brackets saved by `save_simulations` or `SimulationWriter`, read
+    through a memory map so only the brackets that are used are loaded.
+
+    Attributes
+    ----------
+    year : int
+        Year of the NCAA tournament
+    model_id : str
+        Name of the model that made the brackets
+    seed : int or None
+        Seed the brackets were simulated with
+    format : str
+        How the brackets are stored, ``'codes'`` or ``'winners'``
+    data : numpy.memmap
+        The stored brackets, shape (n,) of codes or (n, 63) of winners
+    """
+    def __init__(self, path):
+        """
+        Parameters
+        ----------
+        path : str
+            File to read
+        """
+        header = np.fromfile(path, dtype=_HEADER, count=1)
+        if len(header) == 0 or header['magic'][0] != MAGIC:
+            raise ValueError(f"{path} is not a bracketology simulation file")
+        header = header[0]
+        if header['version'] > VERSION:
+            raise ValueError(f"{path} was written by a newer version of bracketology")
+        self.path = path
+        self.year = int(header['year'])
+        self.model_id = header['model_id'].decode('utf-8')
+        self.seed = int(header['seed']) if header['has_seed'] else None
+        self.format = FORMATS[header['format']]
+        n = int(header['n'])
+        shape = (n,) if self.format == 'codes' else (n, N_GAMES)
+        if n == 0:
+            self.data = np.empty(shape, dtype=_payload_dtype(self.format))
+        else:
+            self.data = np.memmap(path, dtype=_payload_dtype(self.format), mode='r',
+                                  offset=HEADER_SIZE, shape=shape)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return (f"<SimulationFile {self.year} n={len(self)} model_id={self.model_id!r} "
+                f"seed={self.seed} format={self.format}>")
+
+    def codes(self, start=0, stop=None):
+        """
+        Outcome codes of brackets ``start`` to ``stop``
+        """
+        data = self.data[start:stop]
+        return np.asarray(data) if self.format == 'codes' else pack_outcomes(data)
+
+    def winners(self, start=0, stop=None):
+        """
+        Winners of brackets ``start`` to ``stop``, an array of shape (n, 63)
+        """
+        data = self.data[start:stop]
+        return unpack_outcomes(data) if self.format == 'codes' else np.asarray(data)
+
+    def iter_batches(self, batch_size=2**16):
+        """
+        Yield the winners a batch at a time, e.g. to rescore the brackets
+        with `bracketology.streaming.consume` and a different scoring system
+        """
+        for start in range(0, len(self), batch_size):
+            yield self.winners(start, start + batch_size)
+
+    def __getitem__(self, i):
+        """
+        Bracket ``i`` as a `CompactBracket`
+        """
+        return CompactBracket(self.year, self.winners(i, i + 1 if i != -1 else None)[0])
+
+    def to_bracket(self, i):
+        """
+        Bracket ``i`` as a full `Bracket`
+        """
+        return self[i].to_bracket()
+
+def load_simulations(path):
+    """
+    Open a file of simulated brackets, see `SimulationFile`
+    """
+    return SimulationFile(path)
@@ -0,0 +1,217 @@
+import math
+import numpy as np
+from bracketology.engine import ROUND_SLICES, as_fixed, as_win_prob, simulate
+from bracketology.fields import get_field
+from bracketology.scoring import score_brackets
+
+def iter_simulations(year, win_prob, n=None, batch_size=2**16, rng=None, fixed=None):
+    """
+    Generate simulated brackets in batches, using constant memory.
+
+    Parameters
+    ----------
+    year : int
+        Year of the NCAA tournament
+    win_prob : numpy.ndarray, function or ProbabilityModel
+        Same as for `bracketology.engine.simulate`
+    n : int, optional
+        Total number of brackets. The default is to keep going forever
+    batch_size : int, optional
+        Number of brackets in each batch
+    rng : numpy.random.Generator or int, optional
+        Random number generator, or a seed to create one
+    fixed : array-like or dict, optional
+        Results that are already known, see `bracketology.engine.as_fixed`
+
+    Yields
+    ------
+    winners : numpy.ndarray
+        Array of shape (batch_size, 63) of winners, the last batch may be smaller
+    """
+    rng = np.random.default_rng(rng)
+    win_prob = as_win_prob(year, win_prob)
+    if fixed is not None:
+        fixed = as_fixed(fixed)
+    done = 0
+    while n is None or done < n:
+        size = batch_size if n is None else min(batch_size, n - done)
+        yield simulate(year, size, win_prob, rng=rng, chunk_size=size, fixed=fixed)
+        done += size
+
+def consume(batches, *aggregators, until=None):
+    """
+    Feed every batch to each aggregator, optionally stopping early.
+
+    Parameters
+    ----------
+    batches : iterable of numpy.ndarray
+        Batches of winners, like the ones from `iter_simulations`
+    *aggregators
+        Objects with an ``update(winners)`` method
+    until : function, optional
+        Called after each batch, stops consuming once it returns True
+
+    Returns
+    -------
+    n : int
+        Number of brackets consumed
+    """
+    n = 0
+    for winners in batches:
+        for aggregator in aggregators:
+            aggregator.update(winners)
+        n += len(winners)
+        if until is not None and until():
+            break
+    return n
+
+class RunningStats():
+    """
+    Running count, mean and variance of a stream of values, updated a
+    batch at a time without keeping the values.
+
+    Attributes
+    ----------
+    count : int
+        Number of values seen
+    mean : float
+        Mean of the values
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._sum_squares = 0.0 # sum of squared differences from the mean
+
+    def update(self, values, weights=None):
+        """
+        Add a batch of values, each counted `weights` times if given
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if weights is None:
+            n = values.size
+            if n == 0:
+                return self
+            batch_mean = values.mean()
+            batch_sum_squares = ((values - batch_mean) ** 2).sum()
+        else:
+            weights = np.asarray(weights)
+            n = weights.sum().item()
+            if n == 0:
+                return self
+            batch_mean = (weights * values).sum() / n
+            batch_sum_squares = (weights * (values - batch_mean) ** 2).sum()
+        total = self.count + n
+        delta = batch_mean - self.mean
+        self.mean += delta * n / total
+        self._sum_squares += batch_sum_squares + delta * delta * self.count * n / total
+        self.count = total
+        return self
+
+    @property
+    def variance(self):
+        return self._sum_squares / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        return math.sqrt(self.variance)
+
+    def ci_halfwidth(self, z=1.96):
+        """
+        Half the width of the normal confidence interval for the mean,
+        95% by default
+        """
+        return z * self.std / math.sqrt(self.count) if self.count > 1 else math.inf
+
+    def __repr__(self):
+        return f"<RunningStats n={self.count} mean={self.mean:.4f} std={self.std:.4f}>"
+
+class ScoreStats():
+    """
+    Running statistics of the scores of simulated brackets against the
+    actual results of a year.
+
+    Attributes
+    ----------
+    total_score : RunningStats
+        Statistics of the total score
+    n_games_correct : RunningStats
+        Statistics of the number of games correct
+    """
+    def __init__(self, year, scoring='standard'):
+        """
+        Parameters
+        ----------
+        year : int
+            Year of the NCAA tournament
+        scoring : function or str, optional
+            Scoring system, see `bracketology.scoring.score_brackets`
+        """
+        self.year = year
+        self.scoring = scoring
+        self.total_score = RunningStats()
+        self.n_games_correct = RunningStats()
+
+    def update(self, winners):
+        n_correct_by_round, total_score = score_brackets(self.year, winners, self.scoring)
+        self.total_score.update(total_score)
+        self.n_games_correct.update(n_correct_by_round.sum(axis=1))
+        return self
+
+class AdvancementCounts():
+    """
+    How many times each team won a game in each round.
+
+    Attributes
+    ----------
+    counts : numpy.ndarray
+        Array of shape (64, 6), ``counts[i, r - 1]`` is the number of brackets
+        in which team ``i`` of the `Field` won its round ``r`` game
+    n : int
+        Number of brackets seen
+    """
+    def __init__(self, year):
+        self.field = get_field(year)
+        self.counts = np.zeros((len(self.field), 6), dtype=np.int64)
+        self.n = 0
+
+    def update(self, winners):
+        for r, games in enumerate(ROUND_SLICES):
+            self.counts[:, r] += np.bincount(winners[:, games].ravel(), minlength=len(self.field))
+        self.n += len(winners)
+        return self
+
+    @property
+    def probabilities(self):
+        """
+        Fraction of brackets in which each team won each round, comparable
+        to `bracketology.probability.advancement_probabilities`
+        """
+        return self.counts / max(self.n, 1)
+
+class ChampionHistogram():
+    """
+    How many times each team won the championship.
+
+    Attributes
+    ----------
+    counts : numpy.ndarray
+        Number of titles of each team of the `Field`
+    n : int
+        Number of brackets seen
+    """
+    def __init__(self, year):
+        self.field = get_field(year)
+        self.counts = np.zeros(len(self.field), dtype=np.int64)
+        self.n = 0
+
+    def update(self, winners):
+        self.counts += np.bincount(winners[:, -1], minlength=len(self.field))
+        self.n += len(winners)
+        return self
+
+    def most_common(self, k=10):
+        """
+        The `k` teams that won the most, as a list of (name, count)
+        """
+        order = np.argsort(-self.counts, kind='stable')[:k]
+        return [(self.field.names[i], int(self.counts[i])) for i in order]
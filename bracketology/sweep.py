@@ -0,0 +1,99 @@
+import numpy as np
+from bracketology.backtest import YEARS
+from bracketology.engine import N_GAMES, simulate
+from bracketology.scoring import score_brackets
+from bracketology.simulators import upset_prob_batch
+
+class SweepResult():
+    """
+    Scores of a grid of simulator parameters over many years, from `sweep`.
+
+    Attributes
+    ----------
+    params : list
+        The parameter values, in the order of the first axis of the arrays
+    years : list of int
+        The years, in the order of the second axis of the arrays
+    mean_score, std_score : numpy.ndarray
+        Arrays of shape (n_params, n_years), mean and standard deviation of
+        the total score
+    mean_correct : numpy.ndarray
+        Array of shape (n_params, n_years), mean number of games correct
+    n_sims : int
+        Number of brackets simulated for each parameter and year
+    """
+    def __init__(self, params, years, mean_score, std_score, mean_correct, n_sims):
+        self.params = params
+        self.years = years
+        self.mean_score = mean_score
+        self.std_score = std_score
+        self.mean_correct = mean_correct
+        self.n_sims = n_sims
+
+    @property
+    def overall_score(self):
+        """
+        Mean total score of each parameter over all the years
+        """
+        return self.mean_score.mean(axis=1)
+
+    def best(self):
+        """
+        The parameter with the highest mean score over all the years,
+        and that score
+        """
+        i = int(np.argmax(self.overall_score))
+        return self.params[i], float(self.overall_score[i])
+
+    def __repr__(self):
+        return f"<SweepResult {len(self.params)} params x {len(self.years)} years, n_sims={self.n_sims}>"
+
+def sweep(params, make_win_prob=upset_prob_batch, years=YEARS, n_sims=10_000, seed=0,
+          scoring='standard'):
+    """
+    Score a simulator over a grid of parameter values and many years.
+
+    Every parameter value is simulated with the same uniform draws for a
+    year, so a game goes to the top team exactly when its draw is below the
+    win probability. Differences between parameter values then come from
+    the parameters and not from different random numbers, and the draws
+    are only generated once per year.
+
+    Parameters
+    ----------
+    params : iterable
+        Parameter values to try
+    make_win_prob : function, optional
+        Called with one parameter value, returns a `win_prob` for
+        `bracketology.engine.simulate`. The default is
+        `bracketology.simulators.upset_prob_batch`, sweeping the upset probability
+    years : iterable of int, optional
+        Years of the NCAA tournament to score against. The default is 1985-2019
+    n_sims : int, optional
+        Number of brackets per parameter value and year
+    seed : int, optional
+        Seed for the draws, the draws of each year depend only on it and the year
+    scoring : function or str, optional
+        Scoring system, see `bracketology.scoring.score_brackets`
+
+    Returns
+    -------
+    result : SweepResult
+        Score surface over the parameters and years
+    """
+    params = list(params)
+    years = [int(year) for year in years]
+    win_probs = [make_win_prob(p) for p in params]
+
+    shape = (len(params), len(years))
+    mean_score, std_score, mean_correct = np.empty(shape), np.empty(shape), np.empty(shape)
+    for j, year in enumerate(years):
+        rng = np.random.default_rng(np.random.SeedSequence([seed, year]))
+        draws = rng.random((n_sims, N_GAMES), dtype=np.float32)
+        for i, win_prob in enumerate(win_probs):
+            winners = simulate(year, n_sims, win_prob, draws=draws)
+            n_correct_by_round, total_score = score_brackets(year, winners, scoring)
+            mean_score[i, j] = total_score.mean()
+            std_score[i, j] = total_score.std()
+            mean_correct[i, j] = n_correct_by_round.sum(axis=1).mean()
+    return SweepResult(params, years, mean_score, std_score, mean_correct, n_sims)
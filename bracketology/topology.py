@@ -0,0 +1,384 @@
+import numpy as np
+from bracketology.fields import SEED_ORDER
+
+class Topology():
+    """
+    The shape of a single elimination tournament compiled into flat arrays.
+
+    The main bracket has a power of two number of slots. Each slot holds
+    one team, or the winner of a play-in game between two teams. Teams are
+    numbered in bracket order, with both teams of a play-in next to each
+    other. Games are numbered round by round, play-in games (round 0)
+    first, then the first round from the top of the bracket down, and so
+    on to the championship.
+
+    Every game reads its two teams from a state vector holding the teams
+    followed by the winner of each game: ``top_slot[g]`` and
+    ``bottom_slot[g]`` are either a team index (below `n_teams`) or
+    ``n_teams`` plus the index of the earlier game whose winner plays in
+    game ``g``. Simulating and scoring only walk these arrays, so any
+    format works with the same code.
+
+    Attributes
+    ----------
+    n_slots : int
+        Number of slots in the main bracket
+    n_teams : int
+        Number of teams, including both teams of every play-in
+    n_games : int
+        Number of games, including play-ins
+    top_slot, bottom_slot : numpy.ndarray
+        Where the two teams of each game come from in the state vector
+    round_of_game : numpy.ndarray
+        Round of each game, 0 for play-ins and 1 for the first round
+    round_slices : list of slice
+        Games of each round, for rounds 0 to `n_rounds`. Round 0 is empty
+        when there are no play-ins
+    n_rounds : int
+        Number of rounds in the main bracket
+    region_names : tuple of str
+        Names of the regions in bracket order
+    region_of_game : numpy.ndarray
+        Index of the region each game is in, -1 for games between regions
+    region_of_team : numpy.ndarray
+        Index of the region of each team
+    """
+    def __init__(self, n_slots, play_ins=(), region_names=('',)):
+        """
+        Parameters
+        ----------
+        n_slots : int
+            Number of slots in the main bracket, a power of two
+        play_ins : iterable of int, optional
+            Slots that are filled by the winner of a play-in game
+        region_names : sequence of str, optional
+            Names of the regions in bracket order. The slots are split
+            evenly between them, so their number must be a power of two
+        """
+        if n_slots < 2 or n_slots & (n_slots - 1):
+            raise ValueError("n_slots must be a power of two")
+        n_regions = len(region_names)
+        if n_regions < 1 or n_regions & (n_regions - 1) or n_regions > n_slots:
+            raise ValueError("the number of regions must be a power of two, at most n_slots")
+        play_ins = set(play_ins)
+        if not play_ins <= set(range(n_slots)):
+            raise ValueError("play_ins must be slots of the main bracket")
+        region_size = n_slots // n_regions
+
+        slot_teams = []
+        n_teams = 0
+        for slot in range(n_slots):
+            size = 2 if slot in play_ins else 1
+            slot_teams.append(list(range(n_teams, n_teams + size)))
+            n_teams += size
+        n_games = len(play_ins) + n_slots - 1
+
+        top, bottom, rounds, regions = [], [], [], []
+        sources = []
+        for slot, teams in enumerate(slot_teams):
+            if len(teams) == 2:
+                sources.append(n_teams + len(top))
+                top.append(teams[0])
+                bottom.append(teams[1])
+                rounds.append(0)
+                regions.append(slot // region_size)
+            else:
+                sources.append(teams[0])
+        round_number, width = 1, 2
+        while len(sources) > 1:
+            next_sources = []
+            for j, (a, b) in enumerate(zip(sources[0::2], sources[1::2])):
+                next_sources.append(n_teams + len(top))
+                top.append(a)
+                bottom.append(b)
+                rounds.append(round_number)
+                regions.append(j * width // region_size if width <= region_size else -1)
+            sources = next_sources
+            round_number += 1
+            width *= 2
+
+        self.n_slots = n_slots
+        self.n_teams = n_teams
+        self.n_games = n_games
+        self.n_rounds = round_number - 1
+        self.play_ins = tuple(sorted(play_ins))
+        self.top_slot = np.array(top, dtype=np.intp)
+        self.bottom_slot = np.array(bottom, dtype=np.intp)
+        self.round_of_game = np.array(rounds, dtype=np.int8)
+        first = len(play_ins)
+        self.round_slices = [slice(0, first)]
+        for r in range(1, self.n_rounds + 1):
+            n_round = n_slots >> r
+            self.round_slices.append(slice(first, first + n_round))
+            first += n_round
+        self.region_names = tuple(region_names)
+        self.region_of_game = np.array(regions, dtype=np.int8)
+        self.region_of_team = np.array([slot // region_size for slot, teams in enumerate(slot_teams)
+                                        for _ in teams], dtype=np.int8)
+        self.dtype = np.uint8 if n_teams <= 256 else np.uint16
+
+    def __repr__(self):
+        return (f"<Topology {self.n_teams} teams, {self.n_games} games, "
+                f"{len(self.play_ins)} play-ins, {len(self.region_names)} regions>")
+
+    def game_teams(self, winners):
+        """
+        The two teams that played each game of each bracket.
+
+        Parameters
+        ----------
+        winners : numpy.ndarray
+            Array of shape (n, n_games) of winning team indices
+
+        Returns
+        -------
+        top, bottom : numpy.ndarray
+            Arrays of shape (n, n_games) with the top and bottom team of each game
+        """
+        winners = np.atleast_2d(winners)
+        state = np.empty((len(winners), self.n_teams + self.n_games), dtype=winners.dtype)
+        state[:, :self.n_teams] = np.arange(self.n_teams)
+        state[:, self.n_teams:] = winners
+        return state[:, self.top_slot], state[:, self.bottom_slot]
+
+def seed_order(n):
+    """
+    Seeds of a region of `n` teams from the top of the bracket to the
+    bottom, so the best seeds meet as late as possible. Regions of 16 use
+    the NCAA order `bracketology.fields.SEED_ORDER`.
+    """
+    if n == 16:
+        return SEED_ORDER
+    order = [1]
+    while len(order) < n:
+        size = 2 * len(order)
+        order = [seed for top in order for seed in (top, size + 1 - top)]
+    return tuple(order)
+
+class Tournament():
+    """
+    The teams of any single elimination tournament laid out on a `Topology`,
+    e.g. a women's, NIT or conference tournament. It can be passed wherever
+    the batch tools take a field, such as `simulate_tournament` and the
+    batch simulators, which read ``seeds`` from it.
+
+    Attributes
+    ----------
+    topology : Topology
+        The shape of the tournament
+    names : tuple of str
+        Name of each team, in bracket order
+    seeds : numpy.ndarray
+        Seed of each team, in bracket order
+    index : dict
+        Position of each team, keyed by team name
+    regions : tuple of str
+        Region names in bracket order
+    """
+    def __init__(self, topology, names, seeds):
+        """
+        Parameters
+        ----------
+        topology : Topology
+            The shape of the tournament
+        names : sequence of str
+            Name of each team, in bracket order
+        seeds : sequence of int
+            Seed of each team, in bracket order
+        """
+        if len(names) != topology.n_teams or len(seeds) != topology.n_teams:
+            raise ValueError(f"need a name and seed for each of the {topology.n_teams} teams")
+        self.topology = topology
+        self.names = tuple(names)
+        self.seeds = np.array(seeds, dtype=np.int8)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.regions = topology.region_names
+
+    @classmethod
+    def from_regions(cls, regions, finals=None, order=None):
+        """
+        Build a tournament from teams listed by region, in the same form as
+        the ``Region`` and ``Finals`` data of ``brackets.json``.
+
+        Parameters
+        ----------
+        regions : dict
+            For each region, a list of ``{'Team': name, 'Seed': seed}``. A
+            play-in is a ``'Team'`` that is a list of the two team names
+            sharing the seed. Every region must have the same number of seeds
+        finals : dict or list, optional
+            Region order. Either the ``Finals`` data (``game1``/``game2``
+            with ``team1``/``team2``), or a list of region names in bracket
+            order. The default is the order of `regions`
+        order : sequence of int, optional
+            Seeds of a region from top to bottom, the default is `seed_order`
+
+        Returns
+        -------
+        tournament : Tournament
+        """
+        if finals is None:
+            region_names = list(regions)
+        elif isinstance(finals, dict):
+            region_names = [finals[game][team] for game in sorted(finals)
+                            for team in ('team1', 'team2')]
+        else:
+            region_names = list(finals)
+        region_size = len(regions[region_names[0]])
+        if order is None:
+            order = seed_order(region_size)
+
+        names, seeds, play_ins = [], [], []
+        for k, region in enumerate(region_names):
+            by_seed = {team['Seed']: team['Team'] for team in regions[region]}
+            if len(by_seed) != region_size or set(by_seed) != set(order):
+                raise ValueError(f"region {region} must have one entry for each seed")
+            for i, seed in enumerate(order):
+                teams = by_seed[seed]
+                if isinstance(teams, (list, tuple)):
+                    play_ins.append(k * region_size + i)
+                    names.extend(teams)
+                    seeds.extend([seed] * len(teams))
+                else:
+                    names.append(teams)
+                    seeds.append(seed)
+        topology = Topology(region_size * len(region_names), play_ins, region_names)
+        return cls(topology, names, seeds)
+
+    def results(self, round_winners):
+        """
+        The actual results as a winner array, from the teams that won a
+        game in each round.
+
+        Parameters
+        ----------
+        round_winners : list of iterable of str
+            For each round from 0 (play-ins, may be empty) to the
+            championship, the names of the teams that won a game in it
+
+        Returns
+        -------
+        winners : numpy.ndarray
+            Index of the team that won each game
+        """
+        topology = self.topology
+        state = list(range(topology.n_teams)) + [None] * topology.n_games
+        winners = np.empty(topology.n_games, dtype=topology.dtype)
+        for games, names in zip(topology.round_slices, round_winners):
+            names = set(names)
+            for game in range(games.start, games.stop):
+                top = state[topology.top_slot[game]]
+                bottom = state[topology.bottom_slot[game]]
+                if self.names[top] in names:
+                    winner = top
+                elif self.names[bottom] in names:
+                    winner = bottom
+                else:
+                    raise ValueError(f"no winner given for {self.names[top]} vs {self.names[bottom]}")
+                state[topology.n_teams + game] = winner
+                winners[game] = winner
+        return winners
+
+    def __len__(self):
+        return len(self.names)
+
+    def __repr__(self):
+        return f"<Tournament {len(self)} teams, regions {', '.join(self.regions)}>"
+
+def simulate_tournament(tournament, n_sims, win_prob, rng=None, chunk_size=2**16, draws=None):
+    """
+    Simulate many brackets of any tournament, walking its `Topology`.
+
+    For the 64 team NCAA fields this gives the same brackets as
+    `bracketology.engine.simulate` from the same generator.
+
+    Parameters
+    ----------
+    tournament : Tournament or Field
+        The teams and shape of the tournament. A `Field` uses its
+        ``topology``, the standard 64 team bracket
+    n_sims : int
+        Number of brackets to simulate
+    win_prob : numpy.ndarray or function
+        Either a square matrix with ``win_prob[i, j]`` the probability that
+        team ``i`` beats team ``j`` when ``i`` is the top team, or a function
+        ``win_prob(tournament, top, bottom, round_number)`` returning the
+        probability that each top team wins. Play-ins are round 0
+    rng : numpy.random.Generator or int, optional
+        Random number generator, or a seed to create one
+    chunk_size : int, optional
+        Number of brackets to simulate at a time, bounds memory use
+    draws : numpy.ndarray, optional
+        Array of shape (n_sims, n_games) of uniform random numbers to use
+        instead of `rng`, see `bracketology.engine.simulate`
+
+    Returns
+    -------
+    winners : numpy.ndarray
+        Array of shape (n_sims, n_games) with the index of the team that won
+        each game, games numbered as in `Topology`
+    """
+    topology = tournament.topology
+    rng = np.random.default_rng(rng)
+    winners = np.empty((n_sims, topology.n_games), dtype=topology.dtype)
+    n_teams = topology.n_teams
+    for start in range(0, n_sims, chunk_size):
+        stop = min(start + chunk_size, n_sims)
+        state = np.empty((stop - start, n_teams + topology.n_games), dtype=topology.dtype)
+        state[:, :n_teams] = np.arange(n_teams)
+        for round_number, games in enumerate(topology.round_slices):
+            if games.start == games.stop:
+                continue
+            top = state[:, topology.top_slot[games]]
+            bottom = state[:, topology.bottom_slot[games]]
+            if callable(win_prob):
+                p_top = win_prob(tournament, top, bottom, round_number)
+            else:
+                p_top = win_prob[top, bottom]
+            if draws is None:
+                uniform = rng.random(top.shape, dtype=np.float32)
+            else:
+                uniform = draws[start:stop, games]
+            state[:, n_teams + games.start:n_teams + games.stop] = np.where(uniform < p_top, top, bottom)
+        winners[start:stop] = state[:, n_teams:]
+    return winners
+
+def default_points(topology):
+    """
+    Points for a correct pick in each round: 1 for the first round,
+    doubling every round after, and none for play-ins
+    """
+    return np.array([0] + [1 << r for r in range(topology.n_rounds)], dtype=np.int64)
+
+def score_tournament(tournament, winners, results, points=None):
+    """
+    Score many brackets of any tournament against its actual results.
+
+    Parameters
+    ----------
+    tournament : Tournament or Field
+        The teams and shape of the tournament
+    winners : numpy.ndarray
+        Array of shape (n, n_games) of picked winners
+    results : numpy.ndarray
+        The actual winner of each game, see `Tournament.results`
+    points : array-like, optional
+        Points for a correct pick in each round, indexed by round number
+        (index 0 is play-ins). The default is `default_points`
+
+    Returns
+    -------
+    n_correct_by_round : numpy.ndarray
+        Array of shape (n, n_rounds + 1), number of games correct in each
+        round, column 0 being play-ins
+    total_score : numpy.ndarray
+        Array of shape (n,), total points of each bracket
+    """
+    topology = tournament.topology
+    if points is None:
+        points = default_points(topology)
+    rounds = topology.round_of_game
+    indicator = (rounds[:, None] == np.arange(topology.n_rounds + 1)).astype(np.float32)
+    game_points = np.asarray(points, dtype=np.float32)[rounds]
+    correct = (np.atleast_2d(winners) == np.asarray(results)).astype(np.float32)
+    return (correct @ indicator).astype(np.int64), (correct @ game_points).astype(np.int64)
@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 setup(
   name = 'bracketology',         
   packages = ['bracketology'],
@@ -12,16 +12,18 @@ setup(
   url = 'https://github.com/stahl085/bracketology',   
   download_url = 'https://github.com/stahl085/bracketology/archive/0.0.4.tar.gz', 
   keywords = ['brackets', 'NCAA', 'basketball', 'march', 'madness', 'tournament'],
-  install_requires=[],
+  python_requires='>=3.9',
+  install_requires=['numpy>=1.25'],
+  entry_points={'console_scripts': ['bracketology = bracketology.cli:main']},
   classifiers=[
     'Development Status :: 3 - Alpha',      # Chose either "3 - Alpha", "4 - Beta" or "5 - Production/Stable" 
     'Intended Audience :: Developers',
     'Topic :: Software Development :: Build Tools',
     'License :: OSI Approved :: MIT License',   
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.4',
-    'Programming Language :: Python :: 3.5',
-    'Programming Language :: Python :: 3.6',
-    'Programming Language :: Python :: 3.7',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
+    'Programming Language :: Python :: 3.12',
   ],
 )